@@ -24,9 +24,16 @@
 
 
 import abc
+import                      collections
 import collections.abc as   cabc
 import dataclasses as       dcls
+import                      enum
+import                      math
+import                      operator
+import                      sys
+import                      threading
 import                      types
+import                      weakref
 
 import typing_extensions as typx
 # --- BEGIN: Injected by Copier ---
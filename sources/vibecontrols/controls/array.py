@@ -89,6 +89,16 @@ class ArrayDefinition( __.ControlDefinition ):
     hints: __.typx.Annotated[
         ArrayHints, __.ddoc.Doc( "UI hints for rendering." )
     ] = __.dcls.field( default_factory = ArrayHints )
+    # Maximum size, with absent maximum as largest possible size.
+    _size_max_effective: int = __.dcls.field(
+        default = __.sys.maxsize, init = False, repr = False, compare = False )
+    # Validated default elements, computed once at initialization.
+    _validated_default: tuple[ __.typx.Any, ... ] = __.dcls.field(
+        default = ( ), init = False, repr = False, compare = False )
+    # Most recent validation result.
+    _validated_last: __.typx.Optional[ tuple[ __.typx.Any, ... ] ] = (
+        __.dcls.field(
+            default = None, init = False, repr = False, compare = False ) )
 
     def __post_init__( self ) -> None:
         ''' Validates definition parameters. '''
@@ -107,19 +117,23 @@ class ArrayDefinition( __.ControlDefinition ):
                     issue = "cannot exceed",
                     detail = "maximum size"
                 )
+        if self.size_max is not None:
+            object.__setattr__( self, '_size_max_effective', self.size_max )
         # Normalize default_elements to tuple
-        object.__setattr__(
-            self, 'default_elements', tuple( self.default_elements )
-        )
+        if self.default_elements.__class__ is not tuple:
+            object.__setattr__(
+                self, 'default_elements', tuple( self.default_elements )
+            )
         # Validate default elements
         try:
-            self.validate_value( self.default_elements )
+            validated = self.validate_value( self.default_elements )
         except __.ControlInvalidity as exception:
             raise __.DefinitionInvalidity(
                 parameter = "default_elements",
                 issue = "is invalid",
                 detail = str( exception )
             ) from exception
+        object.__setattr__( self, '_validated_default', validated )
 
     def validate_value(
         self,
@@ -147,48 +161,31 @@ class ArrayDefinition( __.ControlDefinition ):
         )
     ]:
         ''' Validates array value. '''
+        # Most recent result of this definition is valid as is. Identity,
+        # rather than equality, keeps values such as ( 1, ) from passing as
+        # ( True, ).
+        if value is self._validated_last: return value
         if not isinstance( value, __.cabc.Sequence ):
             raise __.TypeInvalidity( expected = "a sequence" )
         sequence_value = __.typx.cast(
             __.cabc.Sequence[ __.typx.Any ], value )
         size = len( sequence_value )
-        if size < self.size_min:
-            raise __.SizeConstraintViolation(
-                minimum = self.size_min,
-                maximum = (
-                    __.absent if self.size_max is None else self.size_max
-                ),
-                actual = size,
-                label = "Array size" )
-        if self.size_max is not None and size > self.size_max:
-            raise __.SizeConstraintViolation(
-                minimum = self.size_min,
-                maximum = self.size_max,
-                actual = size,
-                label = "Array size" )
-        validated_elements: list[ __.typx.Any ] = [ ]
-        for index, element in enumerate( sequence_value ):
-            # Try-except in loop is intentional: provides precise error
-            # messages showing which specific element failed validation
-            try:
-                validated = self.element_definition.validate_value( element )
-                validated_elements.append( validated )
-            except __.ControlInvalidity as exception:  # noqa: PERF203
-                raise __.ElementInvalidity(
-                    index = index, cause = exception ) from exception
+        # Inline bounds check; helper call only to report violation.
+        if not self.size_min <= size <= self._size_max_effective:
+            _validate_size( self, size )
+        # Definitions which only implement the protocol structurally may
+        # lack bulk validation; validate their elements individually.
+        validate_values = getattr(
+            type( self.element_definition ), 'validate_values',
+            __.ControlDefinition.validate_values )
+        validated_elements = validate_values(
+            self.element_definition, sequence_value )
         if not self.allow_duplicates:
-            unique_elements: set[ __.typx.Any ] = set( )
-            for index, element in enumerate( validated_elements ):
-                # Try-except in loop is intentional: elements may not be
-                # hashable, need to provide clear error message
-                try:
-                    if element in unique_elements:
-                        raise __.UniquenessConstraintViolation( index = index )
-                    unique_elements.add( element )
-                except TypeError as exception:  # noqa: PERF203
-                    raise __.UniquenessConstraintViolation(  # pragma: no cover
-                        index = index, hashable = False ) from exception
-        return tuple( validated_elements )
+            try: unique = len( set( validated_elements ) ) == size
+            except TypeError: unique = False
+            if not unique: _validate_elements_uniqueness( validated_elements )
+        object.__setattr__( self, '_validated_last', validated_elements )
+        return validated_elements
 
     def produce_control(
         self,
@@ -204,8 +201,13 @@ class ArrayDefinition( __.ControlDefinition ):
             __.ControlInvalidity, "If the initial value is invalid." )
     ]:
         ''' Produces array control. '''
-        if __.is_absent( initial ):
-            validated = self.validate_value( self.default_elements )
+        # Defaults of this definition are validated at initialization.
+        if (
+            __.is_absent( initial )
+            or initial is self._validated_default
+            or initial is self.default_elements
+        ):
+            validated = self._validated_default
         else:
             validated = self.validate_value( initial )
         return Array( definition = self, current = validated )
@@ -225,9 +227,7 @@ class ArrayDefinition( __.ControlDefinition ):
             Serializes each element using the element definition's
             serialization method.
         '''
-        return [
-            self.element_definition.serialize_value( element )
-            for element in value ]
+        return list( map( self.element_definition.serialize_value, value ) )
 
     def produce_default(
         self
@@ -236,7 +236,7 @@ class ArrayDefinition( __.ControlDefinition ):
         __.ddoc.Doc( "Default array value." )
     ]:
         ''' Produces the default value for this control. '''
-        return self.validate_value( self.default_elements )
+        return self._validated_default
 
 
 class Array( __.Control ):
@@ -253,6 +253,10 @@ class Array( __.Control ):
         tuple[ __.typx.Any, ... ],
         __.ddoc.Doc( "Current array elements." )
     ]
+    # Lazily-computed elements set for uniqueness checks.
+    _elements_set: __.typx.Optional[ frozenset[ __.typx.Any ] ] = (
+        __.dcls.field(
+            default = None, init = False, repr = False, compare = False ) )
 
     def copy(
         self,
@@ -290,8 +294,16 @@ class Array( __.Control ):
         )
     ]:
         ''' Produces copy with element appended. '''
-        new_elements = ( *self.current, element )
-        return self.copy( new_elements )
+        if _overrides_validation( self.definition ):
+            return self.copy( ( *self.current, element ) )
+        index = len( self.current )
+        _validate_size( self.definition, index + 1 )
+        validated = _validate_element( self.definition, index, element )
+        elements_set = None
+        if not self.definition.allow_duplicates:
+            elements_set = self._validate_insertion( index, validated )
+        return self._copy_unchecked(
+            ( *self.current, validated ), elements_set )
 
     def remove_at(
         self,
@@ -314,8 +326,19 @@ class Array( __.Control ):
             raise __.IndexOutOfRange(
                 index = index, length = len( self.current )
             )
-        new_elements = self.current[ :index ] + self.current[ index + 1: ]
-        return self.copy( new_elements )
+        current = self.current
+        size = len( current ) - 1
+        _validate_size( self.definition, size )
+        # Removal from either end needs only one slice.
+        if index == size: new_elements = current[ :-1 ]
+        elif index == 0: new_elements = current[ 1: ]
+        else: new_elements = current[ :index ] + current[ index + 1: ]
+        if _overrides_validation( self.definition ):
+            return self.copy( new_elements )
+        elements_set = self._elements_set
+        if elements_set is not None:
+            elements_set = elements_set - { current[ index ] }
+        return self._copy_unchecked( new_elements, elements_set )
 
     def insert_at(
         self,
@@ -351,10 +374,19 @@ class Array( __.Control ):
                 length = len( self.current ),
                 operation = "insertion"
             )
+        if _overrides_validation( self.definition ):
+            return self.copy(
+                ( *self.current[ :index ], element, *self.current[ index: ] ) )
+        _validate_size( self.definition, len( self.current ) + 1 )
+        validated = _validate_element( self.definition, index, element )
+        elements_set = None
+        if not self.definition.allow_duplicates:
+            elements_set = self._validate_insertion( index, validated )
+        # Concatenation is faster than unpacking slices into a display.
+        current = self.current
         new_elements = (
-            *self.current[ :index ], element, *self.current[ index: ]
-        )
-        return self.copy( new_elements )
+            current[ :index ] + ( validated, ) + current[ index: ] )  # noqa: RUF005
+        return self._copy_unchecked( new_elements, elements_set )
 
     def reorder(
         self,
@@ -378,17 +410,18 @@ class Array( __.Control ):
                 expected_length = len( self.current ),
                 actual_length = len( new_order )
             )
-        if set( new_order ) != set( range( len( self.current ) ) ):
+        if not _is_permutation( new_order, len( self.current ) ):
             raise __.InvalidPermutation(
                 expected_length = len( self.current )
             )
-        try:
-            new_elements = tuple( self.current[ i ] for i in new_order )
-        except IndexError as exception:  # pragma: no cover
-            raise __.InvalidPermutation(  # pragma: no cover
-                expected_length = len( self.current )
-            ) from exception
-        return self.copy( new_elements )
+        current = self.current
+        # Item getter produces scalar rather than tuple for single index.
+        if len( new_order ) > 1:
+            new_elements = __.operator.itemgetter( *new_order )( current )
+        else: new_elements = tuple( [ current[ i ] for i in new_order ] )
+        if _overrides_validation( self.definition ):
+            return self.copy( new_elements )
+        return self._copy_unchecked( new_elements, self._elements_set )
 
     def serialize(
         self
@@ -398,3 +431,96 @@ class Array( __.Control ):
     ]:
         ''' Serializes current value. '''
         return self.definition.serialize_value( self.current )
+
+    def _copy_unchecked(
+        self,
+        elements: tuple[ __.typx.Any, ... ],
+        elements_set: __.typx.Optional[ frozenset[ __.typx.Any ] ] = None,
+    ) -> __.typx.Self:
+        ''' Produces copy with elements which are already validated. '''
+        array = type( self )(
+            definition = self.definition, current = elements )
+        if elements_set is not None:
+            object.__setattr__( array, '_elements_set', elements_set )
+        return array
+
+    def _validate_insertion(
+        self, index: int, element: __.typx.Any
+    ) -> frozenset[ __.typx.Any ]:
+        ''' Validates uniqueness of element to be inserted at index.
+
+            Reports the same index as a full scan of the array would, after
+            insertion of the element. Returns elements set with the element.
+        '''
+        elements_set = self._elements_set
+        if elements_set is None:
+            elements_set = frozenset( self.current )
+            object.__setattr__( self, '_elements_set', elements_set )
+        try: duplicate = element in elements_set
+        except TypeError as exception:
+            raise __.UniquenessConstraintViolation(
+                index = index, hashable = False ) from exception
+        if duplicate:
+            position = self.current.index( element )
+            raise __.UniquenessConstraintViolation(
+                index = index if position < index else position + 1 )
+        return elements_set | { element }
+
+
+def _validate_element(
+    definition: ArrayDefinition, index: int, element: __.typx.Any
+) -> __.typx.Any:
+    ''' Validates single element destined for index in array. '''
+    try: return definition.element_definition.validate_value( element )
+    except __.ControlInvalidity as exception:
+        raise __.ElementInvalidity(
+            index = index, cause = exception ) from exception
+
+
+def _validate_elements_uniqueness(
+    elements: __.cabc.Sequence[ __.typx.Any ]
+) -> None:
+    ''' Locates first duplicate or unhashable element, if any. '''
+    unique_elements: set[ __.typx.Any ] = set( )
+    for index, element in enumerate( elements ):
+        # Try-except in loop is intentional: elements may not be
+        # hashable, need to provide clear error message
+        try:
+            if element in unique_elements:
+                raise __.UniquenessConstraintViolation( index = index )
+            unique_elements.add( element )
+        except TypeError as exception:  # noqa: PERF203
+            raise __.UniquenessConstraintViolation(
+                index = index, hashable = False ) from exception
+
+
+def _is_permutation( order: __.cabc.Sequence[ int ], size: int ) -> bool:
+    ''' Checks whether order is a permutation of indices below size. '''
+    seen = bytearray( size )
+    for index in order:
+        # Integer-like indices, such as from array libraries, are accepted.
+        try: index_ = __.operator.index( index )
+        except TypeError: return False
+        if not 0 <= index_ < size or seen[ index_ ]: return False
+        seen[ index_ ] = 1
+    return True
+
+
+def _overrides_validation( definition: ArrayDefinition ) -> bool:
+    ''' Checks whether definition overrides validation of array values. '''
+    return (
+        type( definition ).validate_value
+        is not ArrayDefinition.validate_value )
+
+
+def _validate_size( definition: ArrayDefinition, size: int ) -> None:
+    ''' Validates array size against definition constraints. '''
+    size_max = definition._size_max_effective  # noqa: SLF001
+    if definition.size_min <= size <= size_max: return
+    raise __.SizeConstraintViolation(
+        minimum = definition.size_min,
+        maximum = (
+            __.absent if definition.size_max is None
+            else definition.size_max ),
+        actual = size,
+        label = "Array size" )
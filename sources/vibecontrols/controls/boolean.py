@@ -42,6 +42,10 @@ class BooleanHints( __.immut.DataclassObject ):
     ] = None
 
 
+# Default hints; shared among definitions since hints are immutable
+_HINTS_DEFAULT = BooleanHints( )
+
+
 class BooleanDefinition( __.ControlDefinition ):
     ''' Boolean control definition.
 
@@ -57,7 +61,21 @@ class BooleanDefinition( __.ControlDefinition ):
     ] = "Value must be a boolean"
     hints: __.typx.Annotated[
         BooleanHints, __.ddoc.Doc( "UI hints for rendering." )
-    ] = __.dcls.field( default_factory = BooleanHints )
+    ] = __.dcls.field( default_factory = lambda: _HINTS_DEFAULT )
+
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes definition parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            # Hints are unhashable; equal definitions still hash equally.
+            hash_ = hash( (
+                self.optional, self.default, self.validation_message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
 
     def validate_value(
         self,
@@ -70,10 +88,50 @@ class BooleanDefinition( __.ControlDefinition ):
         __.ddoc.Raises( __.ControlInvalidity, "If value is not a boolean." )
     ]:
         ''' Validates boolean value with strict type checking. '''
-        if not isinstance( value, bool ):
+        if value is not True and value is not False:
             raise __.ControlInvalidity( self.validation_message )
         return value
 
+    def try_validate_value(
+        self,
+        value: __.typx.Annotated[
+            __.typx.Any, __.ddoc.Doc( "Value to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        __.Absential[ bool ],
+        __.ddoc.Doc( "Value if it is a boolean. Absent otherwise." )
+    ]:
+        ''' Validates boolean value without raising if invalid. '''
+        # Subclasses may override validation of values.
+        if type( self ).validate_value is not BooleanDefinition.validate_value:
+            return super( ).try_validate_value( value )
+        if value is True or value is False: return value
+        return __.absent
+
+    def validate_values(
+        self,
+        values: __.typx.Annotated[
+            __.cabc.Sequence[ __.typx.Any ],
+            __.ddoc.Doc( "Values to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        tuple[ bool, ... ],
+        __.ddoc.Doc( "Values if they are all booleans." ),
+        __.ddoc.Raises(
+            __.ElementInvalidity, "If any value is not a boolean." )
+    ]:
+        ''' Validates sequence of boolean values in bulk.
+
+            Surveys value classes in one pass and only validates values
+            individually to locate an invalid value or if a subclass
+            overrides validation of individual values.
+        '''
+        if (
+            type( self ).validate_value is BooleanDefinition.validate_value
+            and set( map( type, values ) ) <= { bool }
+        ): return tuple( values )
+        return super( ).validate_values( values )
+
     def produce_control(
         self,
         initial: __.typx.Annotated[
@@ -129,6 +187,18 @@ class Boolean( __.Control ):
         bool, __.ddoc.Doc( "Current boolean value." )
     ]
 
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes definition and current value, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.definition, self.current ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def copy(
         self,
         value: __.typx.Annotated[
@@ -154,7 +224,15 @@ class Boolean( __.Control ):
         __.ddoc.Doc( "New Boolean control with the toggled value." )
     ]:
         ''' Toggles the boolean value. '''
-        return self.copy( not self.current )
+        definition = self.definition
+        # Subclasses may override validation of values.
+        if type( definition ).validate_value is not (
+            BooleanDefinition.validate_value
+        ): return self.copy( not self.current )
+        # Negation always produces a boolean; no validation needed.
+        return type( self )(
+            definition = definition, current = not self.current
+        )
 
     def serialize(
         self
@@ -26,6 +26,8 @@ from . import __
 
 # Floating-point comparison tolerance for step alignment validation
 _FLOAT_EPSILON = 1e-10
+# Classes accepted as numeric values (includes subclasses, such as bool)
+_NUMERIC_TYPES = ( int, float )
 
 
 class IntervalHints( __.immut.DataclassObject ):
@@ -57,6 +59,10 @@ class IntervalHints( __.immut.DataclassObject ):
     ] = None
 
 
+# Default hints, shared by definitions which do not specify hints
+_HINTS_DEFAULT = IntervalHints( )
+
+
 class IntervalDefinition( __.ControlDefinition ):
     ''' Interval control definition.
 
@@ -85,7 +91,22 @@ class IntervalDefinition( __.ControlDefinition ):
     ] = "Value must be numeric"
     hints: __.typx.Annotated[
         IntervalHints, __.ddoc.Doc( "UI hints for rendering." )
-    ] = __.dcls.field( default_factory = IntervalHints )
+    ] = __.dcls.field( default_factory = lambda: _HINTS_DEFAULT )
+
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes definition parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            # Hints are unhashable; equal definitions still hash equally.
+            hash_ = hash( (
+                self.optional, self.minimum, self.maximum, self.default,
+                self.grade, self.validation_message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
 
     def __post_init__( self ) -> None:
         ''' Validates definition parameters. '''
@@ -143,23 +164,75 @@ class IntervalDefinition( __.ControlDefinition ):
         )
     ]:
         ''' Validates numeric value with range and step checking. '''
-        if not isinstance( value, ( int, float ) ):
+        # Exact class lookup avoids subclass check for common values.
+        if not (
+            type( value ) in _NUMERIC_TYPES
+            or isinstance( value, _NUMERIC_TYPES )
+        ):
             raise __.ControlInvalidity( self.validation_message )
-        if not self.minimum <= value <= self.maximum:
-            raise __.BoundsConstraintViolation(
-                minimum = self.minimum,
-                maximum = self.maximum,
-                actual = float( value )
-            )
-        if self.grade is not None:
-            steps_from_minimum = ( value - self.minimum ) / self.grade
-            deviation = abs( steps_from_minimum - round( steps_from_minimum ) )
-            if not deviation < _FLOAT_EPSILON:
-                raise __.StepConstraintViolation(
-                    step = self.grade, minimum = self.minimum
-                )
+        return _validate_number( self, value )
+
+    def try_validate_value(
+        self,
+        value: __.typx.Annotated[
+            __.typx.Any, __.ddoc.Doc( "Value to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        __.Absential[ float ],
+        __.ddoc.Doc(
+            "Value if it is valid numeric within range. Absent otherwise." )
+    ]:
+        ''' Validates numeric value without raising if invalid. '''
+        # Subclasses may override validation of values.
+        if (
+            type( self ).validate_value
+            is not IntervalDefinition.validate_value
+        ): return super( ).try_validate_value( value )
+        if not (
+            type( value ) in _NUMERIC_TYPES
+            or isinstance( value, _NUMERIC_TYPES )
+        ):
+            return __.absent
+        if _survey_number( self, value ) is not None: return __.absent
         return float( value )
 
+    def validate_values(
+        self,
+        values: __.typx.Annotated[
+            __.cabc.Sequence[ __.typx.Any ],
+            __.ddoc.Doc( "Values to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        tuple[ float, ... ],
+        __.ddoc.Doc( "Values if they are valid numerics within range." ),
+        __.ddoc.Raises(
+            __.ElementInvalidity,
+            "If any value is invalid, identifying the first by index."
+        )
+    ]:
+        ''' Validates sequence of numeric values in bulk.
+
+            Surveys value classes and range extremes in single passes and
+            only validates values individually to locate an invalid value
+            or if a subclass overrides validation of individual values.
+        '''
+        if not values: return ( )
+        if (
+            type( self ).validate_value is IntervalDefinition.validate_value
+            and set( map( type, values ) ) <= { bool, float, int }
+        ):
+            # Sum is NaN if any value is NaN, which range extremes would skip.
+            try: total = sum( values )
+            except OverflowError: total = __.math.nan
+            if (
+                not __.math.isnan( total )
+                and self.minimum <= min( values )
+                and max( values ) <= self.maximum
+                and _are_graded( self, values )
+            ):
+                return tuple( map( float, values ) )
+        return super( ).validate_values( values )
+
     def produce_control(
         self,
         initial: __.typx.Annotated[
@@ -215,6 +288,18 @@ class Interval( __.Control ):
         float, __.ddoc.Doc( "Current numeric value." )
     ]
 
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes definition and current value, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.definition, self.current ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def copy(
         self,
         value: __.typx.Annotated[
@@ -248,10 +333,17 @@ class Interval( __.Control ):
         )
     ]:
         ''' Produces copy with value incremented by grade. '''
-        if self.definition.grade is None:
+        definition = self.definition
+        grade = definition.grade
+        if grade is None:
             raise __.IncrementOperationFailure( operation = "increment" )
-        new_value = self.current + self.definition.grade
-        return self.copy( new_value )
+        # Subclasses may override validation of values.
+        if type( definition ).validate_value is not (
+            IntervalDefinition.validate_value
+        ): return self.copy( self.current + grade )
+        # Sum of numbers is numeric; only range and step need checking.
+        validated = _validate_number( definition, self.current + grade )
+        return type( self )( definition = definition, current = validated )
 
     def decrement(
         self
@@ -268,10 +360,17 @@ class Interval( __.Control ):
         )
     ]:
         ''' Produces copy with value decremented by grade. '''
-        if self.definition.grade is None:
+        definition = self.definition
+        grade = definition.grade
+        if grade is None:
             raise __.IncrementOperationFailure( operation = "decrement" )
-        new_value = self.current - self.definition.grade
-        return self.copy( new_value )
+        # Subclasses may override validation of values.
+        if type( definition ).validate_value is not (
+            IntervalDefinition.validate_value
+        ): return self.copy( self.current - grade )
+        # Difference of numbers is numeric; only range and step need checking.
+        validated = _validate_number( definition, self.current - grade )
+        return type( self )( definition = definition, current = validated )
 
     def serialize(
         self
@@ -281,3 +380,50 @@ class Interval( __.Control ):
     ]:
         ''' Serializes current value. '''
         return self.definition.serialize_value( self.current )
+
+
+def _are_graded(
+    definition: IntervalDefinition, values: __.cabc.Sequence[ float ]
+) -> bool:
+    ''' Checks whether all values lie on grade of definition. '''
+    grade = definition.grade
+    if grade is None: return True
+    minimum = definition.minimum
+    remainder = __.math.remainder
+    # Same check as for single numbers, inlined for bulk validation.
+    return all(
+        abs( remainder( ( value - minimum ) / grade, 1.0 ) ) < _FLOAT_EPSILON
+        for value in values )
+
+
+def _survey_number(
+    definition: IntervalDefinition, value: float
+) -> __.typx.Optional[ type[ __.ConstraintViolation ] ]:
+    ''' Finds constraint of definition violated by number, if any. '''
+    minimum = definition.minimum
+    if not minimum <= value <= definition.maximum:
+        return __.BoundsConstraintViolation
+    grade = definition.grade
+    if grade is None: return None
+    # Remainder is exact distance to nearest whole number of steps.
+    deviation = abs( __.math.remainder( ( value - minimum ) / grade, 1.0 ) )
+    if not deviation < _FLOAT_EPSILON: return __.StepConstraintViolation
+    return None
+
+
+def _validate_number(
+    definition: IntervalDefinition, value: float
+) -> float:
+    ''' Validates number against range and grade of definition. '''
+    violation = _survey_number( definition, value )
+    if violation is None: return float( value )
+    if violation is __.BoundsConstraintViolation:
+        raise __.BoundsConstraintViolation(
+            minimum = definition.minimum,
+            maximum = definition.maximum,
+            actual = float( value )
+        )
+    raise __.StepConstraintViolation(
+        step = __.typx.cast( float, definition.grade ),
+        minimum = definition.minimum
+    )
@@ -72,6 +72,13 @@ class OptionsDefinition( __.ControlDefinition ):
     hints: __.typx.Annotated[
         OptionsHints, __.ddoc.Doc( "UI hints for rendering." )
     ] = __.dcls.field( default_factory = OptionsHints )
+    # Positions of choices, for constant-time lookup.
+    _choice_index: dict[ __.typx.Any, int ] = __.dcls.field(
+        default_factory = dict[ __.typx.Any, int ],
+        init = False, repr = False, compare = False )
+    # Validated default, computed once at initialization.
+    _validated_default: __.typx.Any = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
 
     def __post_init__( self ) -> None:
         ''' Validates definition parameters and normalizes choices. '''
@@ -79,19 +86,24 @@ class OptionsDefinition( __.ControlDefinition ):
             raise __.DefinitionInvalidity(
                 parameter = "choices", issue = "cannot be empty"
             )
-        object.__setattr__( self, 'choices', tuple( self.choices ) )
-        if len( self.choices ) != len( set( self.choices ) ):
+        choices = tuple( self.choices )
+        object.__setattr__( self, 'choices', choices )
+        # Repeated choices collapse in the index, revealing duplicates.
+        choice_index = dict( zip( choices, range( len( choices ) ) ) )
+        if len( choice_index ) != len( choices ):
             raise __.DefinitionInvalidity(
                 parameter = "choices", issue = "must be unique"
             )
+        object.__setattr__( self, '_choice_index', choice_index )
         try:
-            self.validate_value( self.default )
+            validated = self.validate_value( self.default )
         except __.ControlInvalidity as exception:
             raise __.DefinitionInvalidity(
                 parameter = "default",
                 issue = "is invalid",
                 detail = str( exception )
             ) from exception
+        object.__setattr__( self, '_validated_default', validated )
 
     def validate_value(
         self,
@@ -114,21 +126,35 @@ class OptionsDefinition( __.ControlDefinition ):
     ]:
         ''' Validates value is from available choices. '''
         if self.allow_multiple:
-            if not isinstance( value, __.cabc.Sequence ):  # pragma: no cover
+            sequence_value: __.cabc.Sequence[ __.typx.Any ] = value
+            # Check common concrete sequences before consulting the ABC.
+            if (
+                sequence_value.__class__ is not list
+                and sequence_value.__class__ is not tuple
+                and not isinstance( sequence_value, __.cabc.Sequence )
+            ):  # pragma: no cover
                 raise __.TypeInvalidity( expected = "a sequence" )
-            sequence_value = __.typx.cast(
-                __.cabc.Sequence[ __.typx.Any ], value )
             if not sequence_value:
                 raise __.SizeConstraintViolation(
                     minimum = 1, maximum = __.absent, actual = 0,
                     label = "Selection count" )
-            for item in sequence_value:
-                if item not in self.choices:
-                    raise __.SelectionConstraintViolation( value = item )
-            if len( sequence_value ) != len( set( sequence_value ) ):
-                raise __.UniquenessConstraintViolation( )
+            try: selection = set( sequence_value )
+            except TypeError: selection = None
+            if selection is None or not (
+                self._choice_index.keys( ) >= selection
+            ):
+                # Locate first item which is not among choices.
+                for item in sequence_value:
+                    if item not in self.choices:
+                        raise __.SelectionConstraintViolation( value = item )
+                if selection is None: selection = set( sequence_value )
+            if len( sequence_value ) != len( selection ):
+                raise __.UniquenessConstraintViolation(
+                    index = _locate_duplicate( sequence_value ) )
             return tuple( sequence_value )
-        if value not in self.choices:
+        try: valid = value in self._choice_index
+        except TypeError: valid = value in self.choices
+        if not valid:
             raise __.ControlInvalidity( self.validation_message )
         return value
 
@@ -149,7 +175,7 @@ class OptionsDefinition( __.ControlDefinition ):
     ]:
         ''' Produces options control. '''
         if __.is_absent( initial ):
-            validated = self.validate_value( self.default )
+            validated = self._validated_default
         else:
             validated = self.validate_value( initial )
         return Options( definition = self, current = validated )
@@ -182,7 +208,7 @@ class OptionsDefinition( __.ControlDefinition ):
         __.ddoc.Doc( "Default value." )
     ]:
         ''' Produces the default value for this control. '''
-        return self.validate_value( self.default )
+        return self._validated_default
 
 
 class Options( __.Control ):
@@ -215,7 +241,17 @@ class Options( __.Control ):
             __.ControlInvalidity, "If the new value is invalid."
         )
     ]:
-        ''' Produces copy with a new value (immutable operation). '''
+        ''' Produces copy with a new value (immutable operation).
+
+            Returns this control if a single choice is unchanged.
+        '''
+        current = self.current
+        if (
+            not self.definition.allow_multiple
+            and value.__class__ is current.__class__
+            and value == current
+        ):
+            return self
         validated = self.definition.validate_value( value )
         return type( self )(
             definition = self.definition, current = validated
@@ -232,11 +268,20 @@ class Options( __.Control ):
         )
     ]:
         ''' Produces copy with next choice selected (wraps to first). '''
-        if self.definition.allow_multiple:
+        definition = self.definition
+        if definition.allow_multiple:
             raise __.CycleOperationFailure( )
-        current_index = self.definition.choices.index( self.current )
-        next_index = ( current_index + 1 ) % len( self.definition.choices )
-        return self.copy( self.definition.choices[ next_index ] )
+        choices = definition.choices
+        current_index = _index_choice( definition, self.current )
+        # Negative index wraps from last choice to first without modulo.
+        next_index = current_index + 1 - len( choices )
+        # Subclasses may override validation of values.
+        if type( definition ).validate_value is not (
+            OptionsDefinition.validate_value
+        ): return self.copy( choices[ next_index ] )
+        # Choices are valid by construction; no validation needed.
+        return type( self )(
+            definition = definition, current = choices[ next_index ] )
 
     def cycle_previous(
         self
@@ -249,13 +294,19 @@ class Options( __.Control ):
         )
     ]:
         ''' Produces copy with previous choice selected (wraps to last). '''
-        if self.definition.allow_multiple:
+        definition = self.definition
+        if definition.allow_multiple:
             raise __.CycleOperationFailure( )
-        current_index = self.definition.choices.index( self.current )
-        previous_index = (
-            ( current_index - 1 ) % len( self.definition.choices )
-        )
-        return self.copy( self.definition.choices[ previous_index ] )
+        current_index = _index_choice( definition, self.current )
+        # Index of -1 wraps from first choice to last without modulo.
+        previous_index = current_index - 1
+        # Subclasses may override validation of values.
+        if type( definition ).validate_value is not (
+            OptionsDefinition.validate_value
+        ): return self.copy( definition.choices[ previous_index ] )
+        return type( self )(
+            definition = definition,
+            current = definition.choices[ previous_index ] )
 
     def serialize(
         self
@@ -265,3 +316,19 @@ class Options( __.Control ):
     ]:
         ''' Serializes current value. '''
         return self.definition.serialize_value( self.current )
+
+
+def _index_choice( definition: OptionsDefinition, choice: __.typx.Any ) -> int:
+    ''' Produces position of choice among choices of definition. '''
+    return definition._choice_index[ choice ]  # noqa: SLF001
+
+
+def _locate_duplicate(
+    values: __.cabc.Sequence[ __.typx.Any ]
+) -> __.Absential[ int ]:
+    ''' Produces index of first value which repeats an earlier value. '''
+    seen: set[ __.typx.Any ] = set( )
+    for index, value in enumerate( values ):
+        if value in seen: return index
+        seen.add( value )
+    return __.absent  # pragma: no cover
@@ -218,8 +218,20 @@ class Text( __.Control ):
         __.typx.Self,
         __.ddoc.Doc( "New Text control with empty value." )
     ]:
-        ''' Produces copy with empty text. '''
-        return self.copy( '' )
+        ''' Produces copy with empty text.
+
+            Empty text satisfies any maximum character count, so it is only
+            validated if the definition requires a minimum character count
+            or overrides validation.
+        '''
+        definition = self.definition
+        if (
+            definition.count_min
+            or type( definition ).validate_value
+            is not TextDefinition.validate_value
+        ): current = definition.validate_value( '' )
+        else: current = ''
+        return type( self )( definition = definition, current = current )
 
     def serialize(
         self
@@ -85,19 +85,12 @@ class DefinitionInvalidity( ControlError, ValueError ):
         issue: __.Absential[ str ] = __.absent,
         detail: __.Absential[ str ] = __.absent
     ):
-        parts: list[ str ] = [ ]
-        if not __.is_absent( parameter ):
-            parts.append( f"Parameter '{parameter}'" )
-        else:
-            parts.append( "Control definition" )
-        if not __.is_absent( issue ):
-            parts.append( issue )
-        else:
-            parts.append( "is invalid" )
-        if not __.is_absent( detail ):
-            message = f"{' '.join(parts)}: {detail}."
-        else:
-            message = f"{' '.join(parts)}."
+        subject = (
+            "Control definition" if __.is_absent( parameter )
+            else f"Parameter '{parameter}'" )
+        if __.is_absent( issue ): issue = "is invalid"
+        if __.is_absent( detail ): message = f"{ subject } { issue }."
+        else: message = f"{ subject } { issue }: { detail }."
         super( ).__init__( message )
 
 
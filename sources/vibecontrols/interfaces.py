@@ -63,6 +63,60 @@ class ControlDefinition( __.immut.DataclassProtocol, __.typx.Protocol ):
         ''' Validates and normalizes a value for this control. '''
         raise NotImplementedError
 
+    def try_validate_value(
+        self,
+        value: __.typx.Annotated[
+            __.typx.Any, __.ddoc.Doc( "Value to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        __.Absential[ __.typx.Any ],
+        __.ddoc.Doc(
+            "Validated (and possibly normalized) value. "
+            "Absent if the value is invalid."
+        )
+    ]:
+        ''' Validates and normalizes a value without raising if invalid.
+
+            Suits speculative validation, such as of partial user input.
+            Definitions which can check values without raising should
+            override this to avoid the cost of exceptions.
+        '''
+        try: return self.validate_value( value )
+        except _exceptions.ControlInvalidity: return __.absent
+
+    def validate_values(
+        self,
+        values: __.typx.Annotated[
+            __.cabc.Sequence[ __.typx.Any ],
+            __.ddoc.Doc( "Values to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        tuple[ __.typx.Any, ... ],
+        __.ddoc.Doc( "Validated (and possibly normalized) values." ),
+        __.ddoc.Raises(
+            _exceptions.ElementInvalidity,
+            "If any value is invalid, identifying the first by index."
+        )
+    ]:
+        ''' Validates and normalizes a sequence of values for this control.
+
+            Validates each value in turn. Definitions which can check many
+            values in bulk may override this, but should defer to it for
+            locating the first invalid value.
+        '''
+        validated: list[ __.typx.Any ] = [ ]
+        # Bind once rather than resolving attributes for every value.
+        validate = self.validate_value
+        append = validated.append
+        for index, value in enumerate( values ):
+            # Try-except in loop is intentional: provides precise error
+            # messages showing which specific value failed validation
+            try: append( validate( value ) )
+            except _exceptions.ControlInvalidity as exception:  # noqa: PERF203
+                raise _exceptions.ElementInvalidity(
+                    index = index, cause = exception ) from exception
+        return tuple( validated )
+
     @__.abc.abstractmethod
     def produce_control(
         self,
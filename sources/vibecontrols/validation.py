@@ -24,6 +24,25 @@
 from . import __
 from .exceptions import ConstraintViolation as _ConstraintViolation
 from .exceptions import ControlInvalidity as _ControlInvalidity
+from .exceptions import ElementInvalidity as _ElementInvalidity
+
+
+_FusedValidator: __.typx.TypeAlias = (
+    __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ] )
+
+
+# Validators shared by 'of' factories, by class and arguments.
+# Least recently produced validators are evicted beyond the size limit.
+_interned_validators: __.collections.OrderedDict[
+    __.typx.Hashable, __.typx.Any
+] = __.collections.OrderedDict( )
+_interned_validators_mutex = __.threading.Lock( )
+_INTERNED_VALIDATORS_SIZE = 256
+# Choice sets shared by selection validators, while any are in use.
+# Keyed by hash, so that keys do not keep choice sets alive.
+_interned_choices: __.weakref.WeakValueDictionary[
+    int, frozenset[ __.typx.Any ]
+] = __.weakref.WeakValueDictionary( )
 
 
 class Validator( __.immut.DataclassProtocol, __.typx.Protocol ):
@@ -66,8 +85,29 @@ class CompositeValidator( Validator ):
             0.5
     '''
 
+    # Calls before compiling fused function, which amortize its compilation.
+    _FUSION_CALLS_MINIMUM = 256
+
     validators: tuple[ Validator, ... ]
 
+    # Calls applying validators in sequence, before compilation.
+    _calls: int = __.dcls.field(
+        default = 0, init = False, repr = False, compare = False )
+    # Fused validation function, compiled on first request.
+    _fused: __.typx.Optional[ _FusedValidator ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( self.validators )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def __call__(
         self,
         value: __.typx.Annotated[
@@ -78,11 +118,107 @@ class CompositeValidator( Validator ):
         __.ddoc.Doc( "Validated value after all validators." ),
         __.ddoc.Raises( _ControlInvalidity, "If any validator fails." )
     ]:
-        ''' Applies validators in sequence. '''
-        result = value
-        for validator in self.validators:
-            result = validator( result )
-        return result
+        ''' Applies validators in sequence.
+
+            Uses the fused function once compiled. Compiles it after enough
+            calls to amortize compilation, which costs several times as
+            much as constructing the composite.
+        '''
+        fused = self._fused
+        if fused is not None: return fused( value )
+        calls = self._calls + 1
+        if calls < self._FUSION_CALLS_MINIMUM:
+            object.__setattr__( self, '_calls', calls )
+            for validator in self.validators: value = validator( value )
+            return value
+        return self.compile_fused( )( value )
+
+    def compile_fused(
+        self
+    ) -> __.typx.Annotated[
+        _FusedValidator,
+        __.ddoc.Doc(
+            "Function which validates as the validators do in sequence." )
+    ]:
+        ''' Compiles validators into a single function.
+
+            Checks of built-in validators are inlined into the function;
+            other validators are called from it. Compiled once and reused
+            thereafter, including by calls to the composite.
+        '''
+        fused = self._fused
+        if fused is None:
+            fused = _compile_fused( self.validators )
+            object.__setattr__( self, '_fused', fused )
+        return fused
+
+    def validate_batch(
+        self,
+        values: __.typx.Annotated[
+            __.cabc.Iterable[ __.typx.Any ],
+            __.ddoc.Doc( "Values to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        tuple[ __.typx.Any, ... ],
+        __.ddoc.Doc( "Validated values after all validators." ),
+        __.ddoc.Raises(
+            _ElementInvalidity,
+            "If any value is invalid, identifying the first by index."
+        )
+    ]:
+        ''' Applies validators in sequence to each of many values.
+
+            Uses the fused function, compiling it if necessary.
+        '''
+        validated: list[ __.typx.Any ] = [ ]
+        # Bind once rather than resolving attributes for every value.
+        validate = self.compile_fused( )
+        append = validated.append
+        for index, value in enumerate( values ):
+            try: append( validate( value ) )
+            except _ControlInvalidity as exception:  # noqa: PERF203
+                raise _ElementInvalidity(
+                    index = index, cause = exception ) from exception
+        return tuple( validated )
+
+    def optimize(
+        self
+    ) -> __.typx.Annotated[
+        'CompositeValidator',
+        __.ddoc.Doc( "Equivalent composite with cheaper validation." )
+    ]:
+        ''' Produces equivalent composite with reordered, combined validators.
+
+            Within each run of adjacent built-in validators, class checks
+            are moved first; other checks keep their order, since interval,
+            size, and selection checks may guard each other against values
+            which they cannot compare, measure, or hash. Class checks accept
+            any value without error, so hoisting them only changes which
+            failure is reported for a value that fails several checks.
+            Notably, class checks then reject unhashable values before
+            selection checks would fail to hash them. Selection validators
+            which convert values to enumeration members transform values,
+            so they end runs and are never reordered. Class validators
+            directly followed by interval validators are then combined into
+            typed interval validators.
+        '''
+        validators: list[ Validator ] = [ ]
+        for validator in _reorder_checks( self.validators ):
+            previous = validators[ -1 ] if validators else None
+            if (
+                type( validator ) is IntervalValidator
+                and type( previous ) is ClassValidator
+            ):
+                validators[ -1 ] = TypedIntervalValidator(
+                    expected_type = previous.expected_type,
+                    minimum = validator.minimum,
+                    maximum = validator.maximum,
+                    class_message = previous.message,
+                    interval_message = validator.message )
+            else: validators.append( validator )
+        validators_ = tuple( validators )
+        if validators_ == self.validators: return self
+        return CompositeValidator( validators = validators_ )
 
 
 class ClassValidator( Validator ):
@@ -104,18 +240,41 @@ class ClassValidator( Validator ):
         __.ddoc.Doc( "Custom error message. If None, generates default." )
     ] = None
 
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.expected_type, self.message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def __post_init__( self ) -> None:
         ''' Computes default message if not provided. '''
         if self.message is None:
-            if isinstance( self.expected_type, tuple ):
-                type_names = ', '.join(
-                    t.__name__ for t in self.expected_type
-                )
-                computed_message = f"Value must be one of: { type_names }"
-            else:
-                type_name = self.expected_type.__name__
-                computed_message = f"Value must be { type_name }"
-            object.__setattr__( self, 'message', computed_message )
+            object.__setattr__(
+                self, 'message', _produce_class_message( self.expected_type ) )
+
+    @classmethod
+    def of(
+        cls,
+        expected_type: __.typx.Annotated[
+            type | tuple[ type, ... ],
+            __.ddoc.Doc( "Expected type or tuple of types." )
+        ],
+        message: __.typx.Annotated[
+            str | None,
+            __.ddoc.Doc( "Custom error message. If None, generates default." )
+        ] = None
+    ) -> __.typx.Annotated[
+        __.typx.Self,
+        __.ddoc.Doc( "Validator shared among callers with same arguments." )
+    ]:
+        ''' Produces shared validator for expected type. '''
+        return _intern( cls, expected_type = expected_type, message = message )
 
     def __call__(
         self,
@@ -128,7 +287,12 @@ class ClassValidator( Validator ):
         __.ddoc.Raises( _ControlInvalidity, "If value is wrong type." )
     ]:
         ''' Validates value type. '''
-        if not isinstance( value, self.expected_type ):
+        expected_type = self.expected_type
+        # Exact class match avoids subclass checks in common case.
+        if (
+            value.__class__ is not expected_type
+            and not isinstance( value, expected_type )
+        ):
             raise _ControlInvalidity( self.message )
         return value
 
@@ -154,14 +318,46 @@ class IntervalValidator( Validator ):
         __.ddoc.Doc( "Custom error message. If None, generates default." )
     ] = None
 
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.minimum, self.maximum, self.message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def __post_init__( self ) -> None:
         ''' Computes default message if not provided. '''
         if self.message is None:
-            computed_message = (
-                f"Value must be between { self.minimum } and { self.maximum } "
-                f"(inclusive)"
-            )
-            object.__setattr__( self, 'message', computed_message )
+            object.__setattr__(
+                self,
+                'message',
+                _produce_interval_message( self.minimum, self.maximum ) )
+
+    @classmethod
+    def of(
+        cls,
+        minimum: __.typx.Annotated[
+            float, __.ddoc.Doc( "Minimum allowed value (inclusive)." )
+        ],
+        maximum: __.typx.Annotated[
+            float, __.ddoc.Doc( "Maximum allowed value (inclusive)." )
+        ],
+        message: __.typx.Annotated[
+            str | None,
+            __.ddoc.Doc( "Custom error message. If None, generates default." )
+        ] = None
+    ) -> __.typx.Annotated[
+        __.typx.Self,
+        __.ddoc.Doc( "Validator shared among callers with same arguments." )
+    ]:
+        ''' Produces shared validator for range. '''
+        return _intern(
+            cls, minimum = minimum, maximum = maximum, message = message )
 
     def __call__(
         self,
@@ -179,6 +375,93 @@ class IntervalValidator( Validator ):
         return value
 
 
+class TypedIntervalValidator( Validator ):
+    ''' Validates value type and numeric range together.
+
+        Equivalent to a class validator followed by an interval validator,
+        but with a single call per value.
+
+        Example:
+            >>> validator = TypedIntervalValidator( float, 0.0, 1.0 )
+            >>> validator( 0.5 )  # valid
+            0.5
+            >>> validator( "text" )  # raises ControlInvalidity
+            >>> validator( 2.0 )  # raises ConstraintViolation
+    '''
+
+    expected_type: __.typx.Annotated[
+        type | tuple[ type, ... ],
+        __.ddoc.Doc( "Expected type or tuple of types." )
+    ]
+    minimum: __.typx.Annotated[
+        float, __.ddoc.Doc( "Minimum allowed value (inclusive)." )
+    ]
+    maximum: __.typx.Annotated[
+        float, __.ddoc.Doc( "Maximum allowed value (inclusive)." )
+    ]
+    class_message: __.typx.Annotated[
+        str | None,
+        __.ddoc.Doc(
+            "Custom error message for wrong type. "
+            "If None, generates default." )
+    ] = None
+    interval_message: __.typx.Annotated[
+        str | None,
+        __.ddoc.Doc(
+            "Custom error message for out of range. "
+            "If None, generates default." )
+    ] = None
+
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( (
+                self.expected_type, self.minimum, self.maximum,
+                self.class_message, self.interval_message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
+    def __post_init__( self ) -> None:
+        ''' Computes default messages if not provided. '''
+        if self.class_message is None:
+            object.__setattr__(
+                self,
+                'class_message',
+                _produce_class_message( self.expected_type ) )
+        if self.interval_message is None:
+            object.__setattr__(
+                self,
+                'interval_message',
+                _produce_interval_message( self.minimum, self.maximum ) )
+
+    def __call__(
+        self,
+        value: __.typx.Annotated[
+            __.typx.Any, __.ddoc.Doc( "Value to validate." )
+        ]
+    ) -> __.typx.Annotated[
+        __.typx.Any,
+        __.ddoc.Doc( "Value if type is correct and in range." ),
+        __.ddoc.Raises( _ControlInvalidity, "If value is wrong type." ),
+        __.ddoc.Raises( _ConstraintViolation, "If value is out of range." )
+    ]:
+        ''' Validates value type and range. '''
+        expected_type = self.expected_type
+        if (
+            value.__class__ is not expected_type
+            and not isinstance( value, expected_type )
+        ):
+            raise _ControlInvalidity( self.class_message )
+        if not self.minimum <= value <= self.maximum:
+            raise _ConstraintViolation( self.interval_message )
+        return value
+
+
 class SizeValidator( Validator ):
     ''' Validates sequence or collection length.
 
@@ -201,9 +484,31 @@ class SizeValidator( Validator ):
         str | None,
         __.ddoc.Doc( "Custom error message. If None, generates default." )
     ] = None
+    # Length bounds, with absent bounds as widest possible bounds.
+    _length_min_effective: int = __.dcls.field(
+        default = 0, init = False, repr = False, compare = False )
+    _length_max_effective: int = __.dcls.field(
+        default = __.sys.maxsize, init = False, repr = False, compare = False )
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.min_length, self.max_length, self.message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
 
     def __post_init__( self ) -> None:
-        ''' Computes default message if not provided. '''
+        ''' Computes effective bounds and default message. '''
+        if self.min_length is not None:
+            object.__setattr__(
+                self, '_length_min_effective', self.min_length )
+        if self.max_length is not None:
+            object.__setattr__(
+                self, '_length_max_effective', self.max_length )
         if self.message is None:
             if self.min_length is not None and self.max_length is not None:
                 computed_message = (
@@ -222,6 +527,34 @@ class SizeValidator( Validator ):
                 computed_message = "Invalid length"
             object.__setattr__( self, 'message', computed_message )
 
+    @classmethod
+    def of(
+        cls,
+        min_length: __.typx.Annotated[
+            int | None,
+            __.ddoc.Doc(
+                "Minimum allowed length (inclusive). None = no minimum." )
+        ] = None,
+        max_length: __.typx.Annotated[
+            int | None,
+            __.ddoc.Doc(
+                "Maximum allowed length (inclusive). None = no maximum." )
+        ] = None,
+        message: __.typx.Annotated[
+            str | None,
+            __.ddoc.Doc( "Custom error message. If None, generates default." )
+        ] = None
+    ) -> __.typx.Annotated[
+        __.typx.Self,
+        __.ddoc.Doc( "Validator shared among callers with same arguments." )
+    ]:
+        ''' Produces shared validator for length bounds. '''
+        return _intern(
+            cls,
+            min_length = min_length,
+            max_length = max_length,
+            message = message )
+
     def __call__(
         self,
         value: __.typx.Annotated[
@@ -234,10 +567,11 @@ class SizeValidator( Validator ):
         __.ddoc.Raises( _ConstraintViolation, "If length is invalid." )
     ]:
         ''' Validates value length. '''
-        length = len( value )
-        if self.min_length is not None and length < self.min_length:
-            raise _ConstraintViolation( self.message )
-        if self.max_length is not None and length > self.max_length:
+        if not (
+            self._length_min_effective
+            <= len( value )
+            <= self._length_max_effective
+        ):
             raise _ConstraintViolation( self.message )
         return value
 
@@ -245,6 +579,11 @@ class SizeValidator( Validator ):
 class SelectionValidator( Validator ):
     ''' Validates value is one of allowed choices.
 
+        If the choices are members of a single enumeration, then values of
+        those members are also accepted and validate to the members. Values
+        must be of the same classes as those of the members; for example,
+        True does not validate to a member with value 1.
+
         Example:
             >>> validator = SelectionValidator( [ "red", "green", "blue" ] )
             >>> validator( "red" )  # valid
@@ -264,11 +603,34 @@ class SelectionValidator( Validator ):
         __.ddoc.Doc( "Custom error message. If None, generates default." )
     ] = None
 
+    # Hash, computed on first request.
+    _hash: __.typx.Optional[ int ] = __.dcls.field(
+        default = None, init = False, repr = False, compare = False )
+    # Enumeration members among choices, by value.
+    _members_by_value: dict[ __.typx.Any, __.enum.Enum ] = __.dcls.field(
+        default_factory = dict[ __.typx.Any, __.enum.Enum ],
+        init = False, repr = False, compare = False )
+
+    def __hash__( self ) -> int:
+        ''' Hashes validator parameters, computing once. '''
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = hash( ( self.choices, self.message ) )
+            object.__setattr__( self, '_hash', hash_ )
+        return hash_
+
     def __post_init__( self ) -> None:
         ''' Normalizes choices and computes default message. '''
         # Normalize choices to frozenset
-        if not isinstance( self.choices, frozenset ):
-            object.__setattr__( self, 'choices', frozenset( self.choices ) )
+        choices: frozenset[ __.typx.Any ] = self.choices
+        if not isinstance( choices, frozenset ):
+            choices = frozenset[ __.typx.Any ]( choices )
+        # Share equal choice sets among validators
+        choices = _share_choices( choices )
+        if choices is not self.choices:
+            object.__setattr__( self, 'choices', choices )
+        object.__setattr__(
+            self, '_members_by_value', _index_members( choices ) )
         # Compute default message if not provided
         if self.message is None:
             # Limit displayed choices to avoid huge error messages
@@ -282,6 +644,25 @@ class SelectionValidator( Validator ):
                 )
             object.__setattr__( self, 'message', computed_message )
 
+    @classmethod
+    def of(
+        cls,
+        choices: __.typx.Annotated[
+            __.cabc.Iterable[ __.typx.Any ],
+            __.ddoc.Doc( "Allowed values." )
+        ],
+        message: __.typx.Annotated[
+            str | None,
+            __.ddoc.Doc( "Custom error message. If None, generates default." )
+        ] = None
+    ) -> __.typx.Annotated[
+        __.typx.Self,
+        __.ddoc.Doc( "Validator shared among callers with same arguments." )
+    ]:
+        ''' Produces shared validator for choices. '''
+        return _intern(
+            cls, choices = frozenset( choices ), message = message )
+
     def __call__(
         self,
         value: __.typx.Annotated[
@@ -293,6 +674,274 @@ class SelectionValidator( Validator ):
         __.ddoc.Raises( _ConstraintViolation, "If value is not in choices." )
     ]:
         ''' Validates value is in allowed choices. '''
-        if value not in self.choices:
-            raise _ConstraintViolation( self.message )
-        return value
+        members = self._members_by_value
+        if members and not isinstance( value, __.enum.Enum ):
+            # Raw values always convert to members, even for integer and
+            # string enumerations whose members equal their values.
+            member = members.get( value, __.absent )
+            if (
+                __.is_absent( member )
+                or member.value.__class__ is not value.__class__
+            ): raise _ConstraintViolation( self.message )
+            return member
+        if value in self.choices: return value
+        raise _ConstraintViolation( self.message )
+
+
+def _compile_fused(
+    validators: __.cabc.Sequence[ Validator ]
+) -> _FusedValidator:
+    ''' Compiles validators into function with inlined checks. '''
+    namespace: dict[ str, __.typx.Any ] = {
+        '_ConstraintViolation': _ConstraintViolation,
+        '_ControlInvalidity': _ControlInvalidity,
+    }
+    lines = [ 'def fused( value ):' ]
+    for index, validator in enumerate( _flatten_validators( validators ) ):
+        # Exact classes only; subclasses may override validation.
+        emitter = _FUSION_EMITTERS.get( type( validator ) )
+        if emitter is None:
+            namespace[ f"validator_{index}" ] = validator
+            lines.append( f"    value = validator_{index}( value )" )
+        else: lines.extend( emitter( validator, index, namespace ) )
+    lines.append( '    return value' )
+    exec( '\n'.join( lines ), namespace )  # noqa: S102
+    return namespace[ 'fused' ]
+
+
+def _flatten_validators(
+    validators: __.cabc.Sequence[ Validator ]
+) -> list[ Validator ]:
+    ''' Replaces nested composites with their validators, recursively. '''
+    flattened: list[ Validator ] = [ ]
+    for validator in validators:
+        if type( validator ) is CompositeValidator:
+            flattened.extend( _flatten_validators( validator.validators ) )
+        else: flattened.append( validator )
+    return flattened
+
+
+def _reorder_checks(
+    validators: __.cabc.Sequence[ Validator ]
+) -> list[ Validator ]:
+    ''' Sorts runs of adjacent built-in validators by check rank. '''
+    reordered: list[ Validator ] = [ ]
+    run: list[ Validator ] = [ ]
+    for validator in validators:
+        if type( validator ) in _CHECK_RANKS and not _transforms( validator ):
+            run.append( validator )
+            continue
+        # Sort is stable; equally ranked checks keep their order.
+        reordered.extend( sorted( run, key = _rank_check ) )
+        run.clear( )
+        reordered.append( validator )
+    reordered.extend( sorted( run, key = _rank_check ) )
+    return reordered
+
+
+def _rank_check( validator: Validator ) -> int:
+    return _CHECK_RANKS[ type( validator ) ]
+
+
+def _transforms( validator: Validator ) -> bool:
+    ''' Does built-in validator possibly return other than its input? '''
+    return (
+        type( validator ) is SelectionValidator
+        and bool( validator._members_by_value ) )  # noqa: SLF001
+
+
+def _index_members(
+    choices: frozenset[ __.typx.Any ]
+) -> dict[ __.typx.Any, __.enum.Enum ]:
+    ''' Indexes choices by value, if members of a single enumeration. '''
+    classes: set[ type ] = { type( choice ) for choice in choices }
+    if len( classes ) != 1 or not issubclass( classes.pop( ), __.enum.Enum ):
+        return { }
+    try: return { choice.value: choice for choice in choices }
+    except TypeError: return { }  # Unhashable member values.
+
+
+def _share_choices(
+    choices: frozenset[ __.typx.Any ]
+) -> frozenset[ __.typx.Any ]:
+    ''' Produces equal choice set in use, if its choices are alike. '''
+    key = hash( choices )
+    shared = _interned_choices.get( key )
+    if shared is None:
+        _interned_choices[ key ] = choices
+        return choices
+    if shared is choices: return shared
+    # Equal choices of different forms, such as 1 and True, would produce
+    # different default messages; such sets are not shared.
+    if shared != choices: return choices
+    forms = { choice: choice for choice in shared }
+    if all( _are_alike( choice, forms[ choice ] ) for choice in choices ):
+        return shared
+    return choices
+
+
+def _are_alike( choice: __.typx.Any, other: __.typx.Any ) -> bool:
+    ''' Checks whether equal choices have same classes throughout. '''
+    if choice is other: return True
+    class_ = choice.__class__
+    if class_ is not other.__class__: return False
+    if class_ is tuple: return all( map( _are_alike, choice, other ) )
+    # Elements of other collections cannot be paired cheaply.
+    return (
+        class_ in ( str, bytes )
+        or not isinstance( choice, __.cabc.Collection ) )
+
+
+def _tag_choices(
+    choices: __.cabc.Iterable[ __.typx.Any ]
+) -> frozenset[ tuple[ type, __.typx.Any ] ]:
+    ''' Pairs choices with their classes. '''
+    tags: list[ tuple[ type, __.typx.Any ] ] = [
+        ( type( choice ), choice ) for choice in choices ]
+    return frozenset( tags )
+
+
+def _intern( cls: type, **arguments: __.typx.Any ) -> __.typx.Any:
+    ''' Produces validator shared among calls with same arguments. '''
+    # Arguments not equal to themselves, such as NaN, would never match.
+    if not all( map( _is_reflexive, arguments.values( ) ) ):
+        return cls( **arguments )
+    # Argument classes distinguish equal arguments, such as 1 and 1.0,
+    # which would produce different default messages.
+    key: tuple[ __.typx.Any, ... ] = (
+        cls, *map( _tag_argument, arguments.values( ) ) )
+    with _interned_validators_mutex:
+        validator = _interned_validators.get( key )
+        if validator is None:
+            validator = cls( **arguments )
+            _interned_validators[ key ] = validator
+            if len( _interned_validators ) > _INTERNED_VALIDATORS_SIZE:
+                _interned_validators.popitem( last = False )
+        else: _interned_validators.move_to_end( key )
+    return validator
+
+
+def _is_reflexive( argument: __.typx.Any ) -> bool:
+    ''' Is argument, or each of its choices, equal to itself? '''
+    if isinstance( argument, frozenset ):
+        return all( map( _is_reflexive, __.typx.cast(
+            frozenset[ __.typx.Any ], argument ) ) )
+    return argument == argument  # noqa: PLR0124
+
+
+def _tag_argument( argument: __.typx.Any ) -> __.typx.Hashable:
+    ''' Pairs argument, or each of its choices, with its class. '''
+    if isinstance( argument, frozenset ):
+        return _tag_choices( __.typx.cast(
+            frozenset[ __.typx.Any ], argument ) )
+    return ( argument.__class__, argument )
+
+
+def _emit_class_check(
+    validator: ClassValidator,
+    index: int,
+    namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    namespace[ f"expected_{index}" ] = validator.expected_type
+    namespace[ f"message_{index}" ] = validator.message
+    return [
+        f"    if ( value.__class__ is not expected_{index}"
+        f" and not isinstance( value, expected_{index} ) ):",
+        f"        raise _ControlInvalidity( message_{index} )" ]
+
+
+def _emit_interval_check(
+    validator: IntervalValidator,
+    index: int,
+    namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    namespace[ f"minimum_{index}" ] = validator.minimum
+    namespace[ f"maximum_{index}" ] = validator.maximum
+    namespace[ f"message_{index}" ] = validator.message
+    return [
+        f"    if not minimum_{index} <= value <= maximum_{index}:",
+        f"        raise _ConstraintViolation( message_{index} )" ]
+
+
+def _emit_typed_interval_check(
+    validator: TypedIntervalValidator,
+    index: int,
+    namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    namespace[ f"expected_{index}" ] = validator.expected_type
+    namespace[ f"minimum_{index}" ] = validator.minimum
+    namespace[ f"maximum_{index}" ] = validator.maximum
+    namespace[ f"class_message_{index}" ] = validator.class_message
+    namespace[ f"interval_message_{index}" ] = validator.interval_message
+    return [
+        f"    if ( value.__class__ is not expected_{index}"
+        f" and not isinstance( value, expected_{index} ) ):",
+        f"        raise _ControlInvalidity( class_message_{index} )",
+        f"    if not minimum_{index} <= value <= maximum_{index}:",
+        f"        raise _ConstraintViolation( interval_message_{index} )" ]
+
+
+def _emit_selection_check(
+    validator: SelectionValidator,
+    index: int,
+    namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    if validator._members_by_value:  # noqa: SLF001
+        # Member lookup by value is not inlined.
+        namespace[ f"validator_{index}" ] = validator
+        return [ f"    value = validator_{index}( value )" ]
+    namespace[ f"choices_{index}" ] = validator.choices
+    namespace[ f"message_{index}" ] = validator.message
+    return [
+        f"    if value not in choices_{index}:",
+        f"        raise _ConstraintViolation( message_{index} )" ]
+
+
+def _emit_size_check(
+    validator: SizeValidator,
+    index: int,
+    namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    namespace[ f"minimum_{index}" ] = (
+        validator._length_min_effective )  # noqa: SLF001
+    namespace[ f"maximum_{index}" ] = (
+        validator._length_max_effective )  # noqa: SLF001
+    namespace[ f"message_{index}" ] = validator.message
+    return [
+        f"    if not minimum_{index} <= len( value ) <= maximum_{index}:",
+        f"        raise _ConstraintViolation( message_{index} )" ]
+
+
+_FUSION_EMITTERS: dict[
+    type[ Validator ],
+    __.cabc.Callable[
+        [ __.typx.Any, int, dict[ str, __.typx.Any ] ], list[ str ] ],
+] = {
+    ClassValidator: _emit_class_check,
+    IntervalValidator: _emit_interval_check,
+    SelectionValidator: _emit_selection_check,
+    SizeValidator: _emit_size_check,
+    TypedIntervalValidator: _emit_typed_interval_check,
+}
+
+
+# Ranks of built-in validators. Only class checks are hoisted; the others
+# may raise errors other than control invalidities on unexpected values.
+_CHECK_RANKS: dict[ type[ Validator ], int ] = {
+    ClassValidator: 0,
+    IntervalValidator: 1,
+    TypedIntervalValidator: 1,
+    SizeValidator: 1,
+    SelectionValidator: 1,
+}
+
+
+def _produce_class_message( expected_type: type | tuple[ type, ... ] ) -> str:
+    if isinstance( expected_type, tuple ):
+        type_names = ', '.join( t.__name__ for t in expected_type )
+        return f"Value must be one of: { type_names }"
+    return f"Value must be { expected_type.__name__ }"
+
+
+def _produce_interval_message( minimum: float, maximum: float ) -> str:
+    return f"Value must be between { minimum } and { maximum } (inclusive)"
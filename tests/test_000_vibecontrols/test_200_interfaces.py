@@ -23,8 +23,35 @@
 
 import inspect
 
+import pytest
+
 from vibecontrols import interfaces
-from vibecontrols.controls import boolean
+from vibecontrols.controls import array, boolean, interval, options, text
+
+
+def _produce_array_definition( **arguments ):
+    return array.ArrayDefinition(
+        element_definition = boolean.BooleanDefinition( ), **arguments )
+
+
+def _produce_interval_definition( **arguments ):
+    return interval.IntervalDefinition(
+        minimum = 0.0, maximum = 1.0, default = 0.0, grade = 0.5,
+        **arguments )
+
+
+def _produce_options_definition( **arguments ):
+    return options.OptionsDefinition(
+        choices = [ 'a', 'b' ], default = 'a', **arguments )
+
+
+_definition_producers = (
+    ( array.ArrayHints, _produce_array_definition ),
+    ( boolean.BooleanHints, boolean.BooleanDefinition ),
+    ( interval.IntervalHints, _produce_interval_definition ),
+    ( options.OptionsHints, _produce_options_definition ),
+    ( text.TextHints, text.TextDefinition ),
+)
 
 
 def test_000_protocol_imports( ):
@@ -112,6 +139,31 @@ def test_160_control_definition_produce_default_signature( ):
     assert callable( definition.produce_default )
 
 
+def test_170_control_definition_validate_values_default( ):
+    ''' ControlDefinition.validate_values validates each value. '''
+    from vibecontrols import exceptions
+    from vibecontrols.controls import text
+    definition = text.TextDefinition( count_max = 3 )
+    assert definition.validate_values( [ 'a', 'bc' ] ) == ( 'a', 'bc' )
+    assert definition.validate_values( [ ] ) == ( )
+    try:
+        definition.validate_values( [ 'a', 'long', 'b' ] )
+        raise AssertionError( "Invalid value should be rejected" )
+    except exceptions.ElementInvalidity as exception:
+        assert 'index 1' in str( exception )
+        assert isinstance(
+            exception.__cause__, exceptions.SizeConstraintViolation )
+
+
+def test_180_control_definition_try_validate_value_default( ):
+    ''' ControlDefinition.try_validate_value returns absent if invalid. '''
+    from absence import absent
+    definition = text.TextDefinition( count_max = 3 )
+    assert definition.try_validate_value( 'abc' ) == 'abc'
+    assert definition.try_validate_value( 'long' ) is absent
+    assert definition.try_validate_value( 42 ) is absent
+
+
 def test_200_control_protocol_structure( ):
     ''' Control protocol has required attributes and methods. '''
     assert hasattr( interfaces.Control, 'definition' )
@@ -195,3 +247,31 @@ def test_320_protocol_nominal_typing( ):
     control = definition.produce_control( True )
     assert callable( definition.validate_value )
     assert callable( control.copy )
+
+
+@pytest.mark.parametrize(
+    ( 'hints_class', 'produce_definition' ), _definition_producers
+)
+def test_400_instances_slotted( hints_class, produce_definition ):
+    ''' Hints, definitions, and controls carry no instance dictionary. '''
+    hints = hints_class( )
+    definition = produce_definition( hints = hints )
+    control = definition.produce_control( )
+    for instance in ( hints, definition, control ):
+        assert not hasattr( instance, '__dict__' )
+
+
+@pytest.mark.parametrize(
+    'produce_definition',
+    # Only these definitions declare themselves hashable.
+    ( boolean.BooleanDefinition, _produce_interval_definition )
+)
+def test_410_equal_instances_hash_equally( produce_definition ):
+    ''' Equal definitions and controls hash equally and serve as keys. '''
+    definition1 = produce_definition( )
+    definition2 = produce_definition( )
+    assert hash( definition1 ) == hash( definition2 )
+    control1 = definition1.produce_control( )
+    control2 = definition2.produce_control( )
+    assert hash( control1 ) == hash( control2 )
+    assert { control1: 'widget' }[ control2 ] == 'widget'
@@ -21,6 +21,8 @@
 ''' Validation framework testing. '''
 
 
+import enum
+
 import pytest
 
 from vibecontrols import exceptions, validation
@@ -40,6 +42,42 @@ def test_010_validator_callable( ):
     assert result is True
 
 
+def test_020_validators_slotted( ):
+    ''' Validators carry no instance dictionary. '''
+    validators = (
+        validation.ClassValidator( expected_type = int ),
+        validation.IntervalValidator( minimum = 0, maximum = 1 ),
+        validation.TypedIntervalValidator(
+            expected_type = int, minimum = 0, maximum = 1 ),
+        validation.SizeValidator( ),
+        validation.SelectionValidator( choices = [ 1 ] ),
+    )
+    composite = validation.CompositeValidator( validators = validators )
+    for instance in ( *validators, composite ):
+        assert not hasattr( instance, '__dict__' )
+
+
+def test_030_equal_validators_hash_equally( ):
+    ''' Equal validators hash equally and serve as keys. '''
+    def produce( ):
+        return validation.CompositeValidator( validators = (
+            validation.ClassValidator( expected_type = int ),
+            validation.IntervalValidator( minimum = 0, maximum = 1 ),
+            validation.TypedIntervalValidator(
+                expected_type = int, minimum = 0, maximum = 1 ),
+            validation.SizeValidator( max_length = 1 ),
+            validation.SelectionValidator( choices = [ 1 ] ),
+        ) )
+    composite1, composite2 = produce( ), produce( )
+    for validator1, validator2 in zip(
+        ( composite1, *composite1.validators ),
+        ( composite2, *composite2.validators )
+    ):
+        assert hash( validator1 ) == hash( validator2 )
+        assert { validator1: True }[ validator2 ]
+    assert hash( composite1 ) == hash( composite1 )
+
+
 def test_100_composite_validator_creation( ):
     ''' CompositeValidator is created with multiple validators. '''
     validator1 = validation.ClassValidator( expected_type = int )
@@ -112,6 +150,156 @@ def test_160_composite_validator_exception_propagation( ):
         composite( 20 )
 
 
+def test_170_composite_validator_compile_fused( ):
+    ''' Fused function validates as composite does. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.ClassValidator( expected_type = ( int, float ) ),
+        validation.IntervalValidator( minimum = 0.0, maximum = 10.0 ),
+        validation.SelectionValidator( choices = [ 1, 2, 3.5 ] ),
+    ) )
+    fused = composite.compile_fused( )
+    assert composite.compile_fused( ) is fused
+    assert fused( 2 ) == 2
+    assert fused( 3.5 ) == 3.5
+    with pytest.raises( exceptions.ControlInvalidity, match = "one of" ):
+        fused( "2" )
+    with pytest.raises(
+        exceptions.ConstraintViolation, match = "between"
+    ):
+        fused( 20 )
+    with pytest.raises(
+        exceptions.ConstraintViolation, match = "must be one of"
+    ):
+        fused( 4 )
+
+
+def test_171_composite_validator_compile_fused_sizes( ):
+    ''' Fused function checks sizes and calls other validators. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.SizeValidator( min_length = 2 ),
+        str.upper,
+    ) )
+    fused = composite.compile_fused( )
+    assert fused( "ab" ) == "AB"
+    with pytest.raises( exceptions.ConstraintViolation, match = "at least" ):
+        fused( "a" )
+
+
+def test_172_composite_validator_compile_fused_empty( ):
+    ''' Fused function of no validators returns value unchanged. '''
+    composite = validation.CompositeValidator( validators = ( ) )
+    assert composite.compile_fused( )( "anything" ) == "anything"
+
+
+def test_173_composite_validator_nested( ):
+    ''' Nested composites validate as their flattened validators. '''
+    inner = validation.CompositeValidator( validators = (
+        validation.ClassValidator( expected_type = str ),
+        validation.CompositeValidator( validators = ( str.upper, ) ),
+    ) )
+    outer = validation.CompositeValidator(
+        validators = ( inner, validation.SizeValidator( max_length = 2 ) ) )
+    assert len( outer.validators ) == 2
+    assert outer( 'ab' ) == 'AB'
+    with pytest.raises( exceptions.ControlInvalidity, match = "must be str" ):
+        outer( 1 )
+    with pytest.raises( exceptions.ConstraintViolation, match = "at most" ):
+        outer( 'abc' )
+
+
+def test_174_composite_validator_calls_before_fusion( ):
+    ''' Composite validates alike before and after compiling. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.IntervalValidator( minimum = 0, maximum = 10 ), abs ) )
+    # Enough calls to pass the fusion threshold.
+    for i in range( 600 ):
+        assert composite( i % 11 ) == i % 11
+    with pytest.raises( exceptions.ConstraintViolation ):
+        composite( 11 )
+
+
+def test_180_composite_validator_validate_batch( ):
+    ''' Batch validation validates each value in sequence. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.ClassValidator( expected_type = str ),
+        str.upper,
+    ) )
+    assert composite.validate_batch( [ 'a', 'b' ] ) == ( 'A', 'B' )
+    assert composite.validate_batch( iter( [ ] ) ) == ( )
+    with pytest.raises(
+        exceptions.ElementInvalidity, match = "index 1"
+    ):
+        composite.validate_batch( [ 'a', 1 ] )
+
+
+def test_190_composite_validator_optimize( ):
+    ''' Optimization combines class and interval validators. '''
+    class_validator = validation.ClassValidator(
+        expected_type = int, message = "Need int" )
+    interval_validator = validation.IntervalValidator(
+        minimum = 0, maximum = 10 )
+    composite = validation.CompositeValidator(
+        validators = ( abs, class_validator, interval_validator ) )
+    optimized = composite.optimize( )
+    assert len( optimized.validators ) == 2
+    combined = optimized.validators[ 1 ]
+    assert isinstance( combined, validation.TypedIntervalValidator )
+    assert combined.class_message == "Need int"
+    assert combined.interval_message == interval_validator.message
+    assert optimized( -5 ) == composite( -5 ) == 5
+    with pytest.raises( exceptions.ControlInvalidity, match = "Need int" ):
+        validation.CompositeValidator(
+            validators = ( class_validator, interval_validator )
+        ).optimize( )( 'x' )
+
+
+def test_191_composite_validator_optimize_unchanged( ):
+    ''' Optimization returns same composite if nothing changes. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.IntervalValidator( minimum = 0, maximum = 10 ),
+        abs,
+        validation.ClassValidator( expected_type = int ),
+    ) )
+    assert composite.optimize( ) is composite
+
+
+def test_192_composite_validator_optimize_reorders( ):
+    ''' Optimization moves class checks first within runs. '''
+    selection = validation.SelectionValidator( choices = [ 'ab', 'cd' ] )
+    size = validation.SizeValidator( max_length = 2 )
+    class_validator = validation.ClassValidator( expected_type = str )
+    composite = validation.CompositeValidator( validators = (
+        selection, size, str.lower, selection, class_validator ) )
+    optimized = composite.optimize( )
+    assert optimized.validators == (
+        selection, size, str.lower, class_validator, selection )
+    assert optimized( 'ab' ) == composite( 'ab' ) == 'ab'
+    unhashable = validation.CompositeValidator(
+        validators = ( selection, class_validator ) )
+    with pytest.raises( TypeError ):
+        unhashable( [ ] )
+    with pytest.raises( exceptions.ControlInvalidity, match = "must be str" ):
+        unhashable.optimize( )( [ ] )
+
+
+def test_193_composite_validator_optimize_keeps_guards( ):
+    ''' Optimization keeps selection checks ahead of size and interval. '''
+    for composite in (
+        validation.CompositeValidator( validators = (
+            validation.SelectionValidator( choices = [ 'ab', 'cd' ] ),
+            validation.SizeValidator( max_length = 5 ) ) ),
+        validation.CompositeValidator( validators = (
+            validation.SelectionValidator( choices = [ 1, 2 ] ),
+            validation.IntervalValidator( minimum = 0, maximum = 10 ) ) ),
+    ):
+        optimized = composite.optimize( )
+        assert optimized.validators == composite.validators
+        with pytest.raises( exceptions.ConstraintViolation ):
+            optimized( None )
+        with pytest.raises( exceptions.ConstraintViolation ):
+            optimized( 'x' )
+
+
 def test_200_class_validator_creation( ):
     ''' ClassValidator is created with type. '''
     validator = validation.ClassValidator( expected_type = bool )
@@ -392,6 +580,27 @@ def test_530_selection_validator_frozenset_normalization( ):
     assert isinstance( validator2.choices, frozenset )
 
 
+def test_535_selection_validator_shares_choices( ):
+    ''' Equal choice sets are shared among validators. '''
+    validator1 = validation.SelectionValidator( choices = [ 'a', 'b' ] )
+    validator2 = validation.SelectionValidator(
+        choices = frozenset( ( 'b', 'a' ) ), message = "Custom" )
+    assert validator1.choices is validator2.choices
+
+
+def test_536_selection_validator_shares_choices_by_class( ):
+    ''' Equal choices of different classes are not shared. '''
+    validator1 = validation.SelectionValidator( choices = [ True ] )
+    validator2 = validation.SelectionValidator( choices = [ 1 ] )
+    assert validator1.choices is not validator2.choices
+    assert type( next( iter( validator2.choices ) ) ) is int
+    assert validator2.message == "Value must be one of: 1"
+    nested1 = validation.SelectionValidator( choices = [ ( True, ) ] )
+    nested2 = validation.SelectionValidator( choices = [ ( 1, ) ] )
+    assert nested1.choices is not nested2.choices
+    assert nested2.message == "Value must be one of: (1,)"
+
+
 def test_540_selection_validator_few_choices_message( ):
     ''' SelectionValidator shows all choices (≤5). '''
     validator = validation.SelectionValidator( choices = [ 'a', 'b', 'c' ] )
@@ -441,3 +650,149 @@ def test_590_selection_validator_hashable_choices( ):
     assert validator( 2 ) == 2
     validator_str = validation.SelectionValidator( choices = [ 'a', 'b' ] )
     assert validator_str( 'a' ) == 'a'
+
+
+class Color( enum.Enum ):
+    RED = 'red'
+    GREEN = 'green'
+    BLUE = 'blue'
+
+
+def test_595_selection_validator_enumeration_values( ):
+    ''' Values of enumeration members among choices validate to members. '''
+    validator = validation.SelectionValidator(
+        choices = [ Color.RED, Color.GREEN ] )
+    assert validator( Color.RED ) is Color.RED
+    assert validator( 'green' ) is Color.GREEN
+    with pytest.raises( exceptions.ConstraintViolation ):
+        validator( 'blue' )
+    fused = validation.CompositeValidator(
+        validators = ( validator, ) ).compile_fused( )
+    assert fused( 'red' ) is Color.RED
+    mixed = validation.SelectionValidator( choices = [ Color.RED, 'x' ] )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        mixed( 'red' )
+
+
+class Level( enum.Enum ):
+    LOW = 1
+    HIGH = 2
+
+
+class Rank( enum.IntEnum ):
+    LOW = 1
+    HIGH = 2
+
+
+def test_596_selection_validator_enumeration_value_classes( ):
+    ''' Only values of member value classes validate to members. '''
+    validator = validation.SelectionValidator( choices = list( Level ) )
+    assert validator( 1 ) is Level.LOW
+    for value in ( True, 1.0 ):
+        with pytest.raises( exceptions.ConstraintViolation ):
+            validator( value )
+    integral = validation.SelectionValidator( choices = list( Rank ) )
+    assert integral( Rank.HIGH ) is Rank.HIGH
+    assert integral( 1 ) is Rank.LOW
+    with pytest.raises( exceptions.ConstraintViolation ):
+        integral( True )
+
+
+def test_597_selection_validator_enumeration_optimize( ):
+    ''' Optimization keeps converting selections ahead of class checks. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.SelectionValidator( choices = [ Color.RED, Color.GREEN ] ),
+        validation.ClassValidator( expected_type = Color ),
+    ) )
+    optimized = composite.optimize( )
+    assert optimized.validators == composite.validators
+    assert optimized( 'red' ) is composite( 'red' ) is Color.RED
+
+
+def test_600_validator_of_shares_instances( ):
+    ''' Factories share validators among calls with same arguments. '''
+    assert (
+        validation.ClassValidator.of( bool )
+        is validation.ClassValidator.of( bool ) )
+    assert (
+        validation.IntervalValidator.of( 0.0, 1.0 )
+        is validation.IntervalValidator.of( 0.0, 1.0 ) )
+    assert (
+        validation.SizeValidator.of( max_length = 3 )
+        is validation.SizeValidator.of( max_length = 3 ) )
+    assert (
+        validation.SelectionValidator.of( [ 'a', 'b' ] )
+        is validation.SelectionValidator.of( ( 'b', 'a' ) ) )
+
+
+def test_610_validator_of_distinguishes_arguments( ):
+    ''' Factories produce distinct validators for distinct arguments. '''
+    assert (
+        validation.ClassValidator.of( bool )
+        is not validation.ClassValidator.of( bool, message = "Custom" ) )
+    assert (
+        validation.IntervalValidator.of( 0.0, 1.0 )
+        is not validation.IntervalValidator.of( 0.0, 2.0 ) )
+    integral = validation.IntervalValidator.of( 0, 1 )
+    assert integral is not validation.IntervalValidator.of( 0.0, 1.0 )
+    assert integral.message == "Value must be between 0 and 1 (inclusive)"
+    boolean = validation.SelectionValidator.of( [ True ] )
+    integer = validation.SelectionValidator.of( [ 1 ] )
+    assert boolean is not integer
+    assert integer.message == "Value must be one of: 1"
+
+
+def test_620_validator_of_validates( ):
+    ''' Shared validators validate as constructed validators do. '''
+    validator = validation.SelectionValidator.of( [ 'a', 'b' ] )
+    assert validator == validation.SelectionValidator( choices = [ 'a', 'b' ] )
+    assert validator( 'a' ) == 'a'
+    with pytest.raises( exceptions.ConstraintViolation ):
+        validator( 'c' )
+
+
+def test_630_validator_of_irreflexive_arguments( ):
+    ''' Arguments not equal to themselves produce unshared validators. '''
+    nan = float( 'nan' )
+    validator = validation.IntervalValidator.of( nan, 1.0 )
+    assert validator is not validation.IntervalValidator.of( nan, 1.0 )
+    assert (
+        validation.SelectionValidator.of( [ nan ] )
+        is not validation.SelectionValidator.of( [ nan ] ) )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        validator( 0.5 )
+
+
+def test_700_typed_interval_validator_valid( ):
+    ''' Value of expected type within range passes. '''
+    validator = validation.TypedIntervalValidator(
+        expected_type = float, minimum = 0.0, maximum = 1.0 )
+    assert validator( 0.5 ) == 0.5
+    assert validator.class_message == "Value must be float"
+    assert "between 0.0 and 1.0" in validator.interval_message
+
+
+def test_710_typed_interval_validator_invalid( ):
+    ''' Wrong type or out of range values fail. '''
+    validator = validation.TypedIntervalValidator(
+        expected_type = ( int, float ), minimum = 0, maximum = 1 )
+    with pytest.raises( exceptions.ControlInvalidity, match = "one of" ):
+        validator( '0.5' )
+    with pytest.raises( exceptions.ConstraintViolation, match = "between" ):
+        validator( 2 )
+
+
+def test_720_typed_interval_validator_fused( ):
+    ''' Fused function inlines typed interval checks. '''
+    composite = validation.CompositeValidator( validators = (
+        validation.TypedIntervalValidator(
+            expected_type = int, minimum = 0, maximum = 1,
+            interval_message = "Custom range" ), ) )
+    fused = composite.compile_fused( )
+    assert fused( 1 ) == 1
+    with pytest.raises( exceptions.ControlInvalidity, match = "must be int" ):
+        fused( 1.0 )
+    with pytest.raises(
+        exceptions.ConstraintViolation, match = "Custom range"
+    ):
+        fused( 2 )
@@ -178,6 +178,52 @@ def test_260_validate_value_exception_type( ):
         definition.validate_value( [ ] )
 
 
+def test_270_validate_values_all_booleans( ):
+    ''' BooleanDefinition validates sequences of booleans in bulk. '''
+    definition = boolean.BooleanDefinition( )
+    result = definition.validate_values( [ True, False, True ] )
+    assert result == ( True, False, True )
+    assert isinstance( result, tuple )
+    assert definition.validate_values( [ ] ) == ( )
+
+
+def test_280_validate_values_reports_invalid_index( ):
+    ''' BooleanDefinition identifies first non-boolean in sequence. '''
+    definition = boolean.BooleanDefinition( )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 2' ):
+        definition.validate_values( [ True, False, 1, 'no' ] )
+
+
+class AffirmativeDefinition( boolean.BooleanDefinition ):
+    ''' Boolean definition which only accepts true. '''
+
+    def validate_value( self, value: object ) -> bool:
+        if value is not True:
+            raise exceptions.ControlInvalidity( "Value must be true" )
+        return value
+
+
+def test_285_validate_values_subclass_override( ):
+    ''' Bulk validation defers to overridden validation of values. '''
+    definition = AffirmativeDefinition( )
+    assert definition.validate_values( [ True, True ] ) == ( True, True )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 1' ):
+        definition.validate_values( [ True, False ] )
+
+
+def test_290_try_validate_value( ):
+    ''' Booleans are returned; other values produce absent. '''
+    from absence import absent
+    definition = boolean.BooleanDefinition( )
+    assert definition.try_validate_value( True ) is True
+    assert definition.try_validate_value( False ) is False
+    assert definition.try_validate_value( 1 ) is absent
+    assert definition.try_validate_value( None ) is absent
+    affirmative = AffirmativeDefinition( )
+    assert affirmative.try_validate_value( True ) is True
+    assert affirmative.try_validate_value( False ) is absent
+
+
 def test_300_produce_control_no_initial( ):
     ''' BooleanDefinition uses default value when no initial provided. '''
     definition = boolean.BooleanDefinition( default = False )
@@ -393,6 +439,13 @@ def test_850_toggle_multiple_times( ):
     assert toggled_thrice.current is True
 
 
+def test_860_toggle_subclass_validation_override( ):
+    ''' Boolean.toggle validates with overridden validation. '''
+    control = AffirmativeDefinition( ).produce_control( True )
+    with pytest.raises( exceptions.ControlInvalidity ):
+        control.toggle( )
+
+
 def test_900_serialize_true( ):
     ''' Boolean.serialize serializes True. '''
     definition = boolean.BooleanDefinition( )
@@ -459,3 +512,11 @@ def test_1030_protocol_compliance( ):
     assert hasattr( control, 'definition' )
     assert hasattr( control, 'current' )
     assert hasattr( control, 'copy' )
+
+
+def test_1060_default_hints_shared( ):
+    ''' Definitions without explicit hints share default hints. '''
+    definition1 = boolean.BooleanDefinition( )
+    definition2 = boolean.BooleanDefinition( default = True )
+    assert definition1.hints is definition2.hints
+    assert definition1.hints == boolean.BooleanHints( )
@@ -491,6 +491,14 @@ def test_750_copy_original_unchanged( ):
     assert original.current == 'original'
 
 
+def test_760_copy_unchanged_invalid_value( ):
+    ''' copy() validates value even if unchanged. '''
+    definition = text.TextDefinition( count_min = 2 )
+    original = definition.produce_control( )
+    with pytest.raises( exceptions.SizeConstraintViolation ):
+        original.copy( '' )
+
+
 # 800-899: Text.clear()
 
 def test_800_clear_returns_empty( ):
@@ -534,6 +542,15 @@ def test_840_clear_with_count_min( ):
         control.clear( )
 
 
+def test_850_clear_with_count_min_after_empty( ):
+    ''' clear() enforces count_min even after clearing empty control. '''
+    definition = text.TextDefinition( count_min = 2 )
+    with pytest.raises( exceptions.SizeConstraintViolation ):
+        definition.produce_control( ).clear( )
+    with pytest.raises( exceptions.SizeConstraintViolation ):
+        definition.produce_control( 'abc' ).clear( )
+
+
 # 900-999: Text.serialize()
 
 def test_900_serialize_string( ):
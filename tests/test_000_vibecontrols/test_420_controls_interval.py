@@ -404,6 +404,42 @@ def test_296_validate_value_custom_message( ):
         definition.validate_value( 'text' )
 
 
+def test_297_validate_values_normalized( ):
+    ''' Valid values are validated in bulk and normalized to floats. '''
+    definition = interval.IntervalDefinition(
+        minimum = 0.0, maximum = 1.0, default = 0.0, grade = 0.25 )
+    result = definition.validate_values( [ 0, 0.25, 1, True ] )
+    assert result == ( 0.0, 0.25, 1.0, 1.0 )
+    assert all( type( value ) is float for value in result )
+    assert definition.validate_values( [ ] ) == ( )
+
+
+def test_298_validate_values_reports_invalid_index( ):
+    ''' First invalid value is identified by index. '''
+    definition = interval.IntervalDefinition(
+        minimum = 0.0, maximum = 1.0, default = 0.0, grade = 0.25 )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 2' ):
+        definition.validate_values( [ 0.5, 0.75, 1.5 ] )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 1' ):
+        definition.validate_values( [ 0.5, 0.6, 0.75 ] )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 1' ):
+        definition.validate_values( [ 0.5, 'text', 0.75 ] )
+    # NaN is rejected, even though range extremes skip it.
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 1' ):
+        definition.validate_values( [ 0.5, float( 'nan' ), 0.75 ] )
+
+
+def test_299_try_validate_value( ):
+    ''' Valid values are normalized; invalid values produce absent. '''
+    definition = interval.IntervalDefinition(
+        minimum = 0.0, maximum = 1.0, default = 0.0, grade = 0.25 )
+    assert definition.try_validate_value( 1 ) == 1.0
+    assert type( definition.try_validate_value( 1 ) ) is float
+    assert definition.try_validate_value( 0.3 ) is absent
+    assert definition.try_validate_value( 2.0 ) is absent
+    assert definition.try_validate_value( '0.5' ) is absent
+
+
 # 300-399: IntervalDefinition.produce_control()
 
 def test_300_produce_control_no_initial( ):
@@ -792,3 +828,30 @@ def test_1040_increment_decrement_chain( ):
     control = definition.produce_control( )
     result = control.increment( ).increment( ).decrement( )
     assert result.current == 60.0
+
+
+class EvenDefinition( interval.IntervalDefinition ):
+    ''' Interval definition which only accepts even numbers. '''
+
+    def validate_value( self, value: object ) -> float:
+        validated = super( ).validate_value( value )
+        if validated % 2:
+            raise exceptions.ConstraintViolation( "Value must be even" )
+        return validated
+
+
+def test_1070_subclass_validation_override( ):
+    ''' Bulk validation defers to overridden validation of values. '''
+    definition = EvenDefinition( minimum = 0, maximum = 10, default = 0 )
+    assert definition.validate_values( [ 2, 4 ] ) == ( 2.0, 4.0 )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 1' ):
+        definition.validate_values( [ 2, 3 ] )
+    assert definition.try_validate_value( 4 ) == 4.0
+    assert definition.try_validate_value( 3 ) is absent
+    graded = EvenDefinition(
+        minimum = 0, maximum = 10, default = 2, grade = 1 )
+    control = graded.produce_control( )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.increment( )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.decrement( )
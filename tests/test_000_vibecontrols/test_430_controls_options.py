@@ -284,10 +284,34 @@ def test_270_validate_value_multi_duplicates( ):
         choices = [ 'a', 'b', 'c' ],
         default = [ 'a' ],
         allow_multiple = True )
-    with pytest.raises( exceptions.UniquenessConstraintViolation ):
+    with pytest.raises(
+        exceptions.UniquenessConstraintViolation, match = "index 2"
+    ):
         definition.validate_value( [ 'a', 'b', 'a' ] )
 
 
+def test_271_validate_value_multi_invalid_precedes_duplicates( ):
+    ''' Invalid choice is reported even when duplicates precede it. '''
+    definition = options.OptionsDefinition(
+        choices = [ 'a', 'b', 'c' ],
+        default = [ 'a' ],
+        allow_multiple = True )
+    with pytest.raises(
+        exceptions.SelectionConstraintViolation, match = "'x'"
+    ):
+        definition.validate_value( [ 'a', 'a', 'x' ] )
+
+
+def test_272_validate_value_multi_unhashable_item( ):
+    ''' Unhashable item in multi-select is an invalid choice. '''
+    definition = options.OptionsDefinition(
+        choices = [ 'a', 'b', 'c' ],
+        default = [ 'a' ],
+        allow_multiple = True )
+    with pytest.raises( exceptions.SelectionConstraintViolation ):
+        definition.validate_value( [ 'a', [ 'b' ] ] )
+
+
 def test_280_validate_value_multi_when_single_expected( ):
     ''' Multiple values when single-select raises ControlInvalidity. '''
     definition = options.OptionsDefinition(
@@ -436,6 +460,17 @@ def test_520_produce_default_custom( ):
     assert result == 4
 
 
+def test_530_produce_default_reused( ):
+    ''' Validated default is computed once and reused. '''
+    definition = options.OptionsDefinition(
+        choices = [ 'a', 'b', 'c' ],
+        default = [ 'a', 'c' ],
+        allow_multiple = True )
+    result = definition.produce_default( )
+    assert definition.produce_default( ) is result
+    assert definition.produce_control( ).current is result
+
+
 # 600-699: Options control creation and attributes
 
 def test_600_options_control_creation( ):
@@ -533,6 +568,26 @@ def test_750_copy_original_unchanged( ):
     assert original.current == 'a'
 
 
+def test_760_copy_unchanged_returns_same_instance( ):
+    ''' copy() with an unchanged single choice returns same control. '''
+    definition = options.OptionsDefinition(
+        choices = [ 1, 2 ], default = 1 )
+    original = definition.produce_control( )
+    assert original.copy( 1 ) is original
+    assert original.copy( 2 ) is not original
+    assert original.copy( True ) is not original
+
+
+def test_770_copy_unchanged_multiple_revalidates( ):
+    ''' copy() of multi-select control always produces new control. '''
+    definition = options.OptionsDefinition(
+        choices = [ 'a', 'b' ], default = [ 'a' ], allow_multiple = True )
+    original = definition.produce_control( )
+    copied = original.copy( ( 'a', ) )
+    assert copied is not original
+    assert copied == original
+
+
 # 800-899: Options.cycle_next() and Options.cycle_previous()
 
 def test_800_cycle_next_valid( ):
@@ -593,6 +648,27 @@ def test_850_cycle_previous_with_multi_select( ):
         control.cycle_previous( )
 
 
+class ExclusiveDefinition( options.OptionsDefinition ):
+    ''' Options definition which rejects one of its choices. '''
+
+    def validate_value( self, value: object ) -> object:
+        if value == 'c':
+            raise exceptions.ConstraintViolation( "Choice is unavailable" )
+        return super( ).validate_value( value )
+
+
+def test_860_cycle_subclass_validation_override( ):
+    ''' Cycling validates with overridden validation. '''
+    definition = ExclusiveDefinition(
+        choices = [ 'a', 'b', 'c' ], default = 'a' )
+    control = definition.produce_control( )
+    assert control.cycle_next( ).current == 'b'
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.cycle_next( ).cycle_next( )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.cycle_previous( )
+
+
 # 900-999: Options.serialize()
 
 def test_900_serialize_single( ):
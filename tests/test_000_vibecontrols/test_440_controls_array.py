@@ -403,6 +403,60 @@ def test_294_validate_value_list_sequence( ):
     assert isinstance( result, tuple )
 
 
+def test_295_validate_value_duplicate_index_reported( ):
+    ''' First repeated element is identified by index. '''
+    from vibecontrols.controls import text
+    element_def = text.TextDefinition( )
+    definition = array.ArrayDefinition(
+        element_definition = element_def, allow_duplicates = False )
+    assert definition.validate_value( [ 'a', 'b', 'c' ] ) == (
+        'a', 'b', 'c' )
+    with pytest.raises(
+        exceptions.UniquenessConstraintViolation, match = 'index 3'
+    ):
+        definition.validate_value( [ 'a', 'b', 'c', 'b', 'a' ] )
+
+
+def test_296_validate_value_reuses_prior_result( ):
+    ''' Most recent validation result is returned as is on revalidation. '''
+    from vibecontrols.controls import interval
+    element_def = interval.IntervalDefinition(
+        minimum = 0, maximum = 10, default = 0 )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    result = definition.validate_value( [ 1, 2 ] )
+    assert definition.validate_value( result ) is result
+    control = definition.produce_control( result )
+    assert control.copy( control.current ).current is result
+
+
+def test_297_validate_value_equal_input_revalidated( ):
+    ''' Equal but distinct input is validated on its own. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    definition.validate_value( ( True, ) )
+    with pytest.raises( exceptions.ElementInvalidity ):
+        definition.validate_value( ( 1, ) )
+
+
+class UppercaseDefinition:
+    ''' Definition of text elements implemented structurally. '''
+
+    optional = False
+
+    def validate_value( self, value: str ) -> str: return value.upper( )
+
+    def serialize_value( self, value: str ) -> str: return value
+
+    def produce_default( self ) -> str: return ''
+
+
+def test_298_validate_value_structural_element_definition( ):
+    ''' Elements validate individually without bulk validation. '''
+    definition = array.ArrayDefinition(
+        element_definition = UppercaseDefinition( ) )
+    assert definition.validate_value( [ 'a', 'b' ] ) == ( 'A', 'B' )
+
+
 # 300-399: ArrayDefinition.produce_control()
 
 def test_300_produce_control_no_initial( ):
@@ -526,6 +580,36 @@ def test_510_produce_default_with_elements( ):
     assert result == ( True, False )
 
 
+
+def test_520_produce_default_normalized_and_reused( ):
+    ''' Default is normalized by element definition and reused. '''
+    from vibecontrols.controls import interval
+    element_def = interval.IntervalDefinition(
+        minimum = 0, maximum = 10, default = 0 )
+    definition = array.ArrayDefinition(
+        element_definition = element_def,
+        default_elements = [ 1, 2 ] )
+    result = definition.produce_default( )
+    assert result == ( 1.0, 2.0 )
+    assert all( type( element ) is float for element in result )
+    assert definition.produce_default( ) is result
+    assert definition.produce_control( ).current is result
+
+
+def test_530_produce_control_from_default_elements( ):
+    ''' Passing default elements produces normalized default. '''
+    from vibecontrols.controls import interval
+    element_def = interval.IntervalDefinition(
+        minimum = 0, maximum = 10, default = 0 )
+    definition = array.ArrayDefinition(
+        element_definition = element_def,
+        default_elements = [ 1, 2 ] )
+    default = definition.produce_default( )
+    control = definition.produce_control( definition.default_elements )
+    assert control.current is default
+    control = definition.produce_control( default )
+    assert control.current is default
+
 # 600-699: Array control creation and attributes
 
 def test_600_array_control_creation( ):
@@ -686,6 +770,16 @@ def test_850_append_original_unchanged( ):
     assert original.current == ( True, )
 
 
+def test_860_append_invalid_element_reports_index( ):
+    ''' Invalid appended element is reported at its new index. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = array.Array(
+        definition = definition, current = ( True, False ) )
+    with pytest.raises( exceptions.ElementInvalidity, match = 'index 2' ):
+        control.append( 'not a bool' )
+
+
 # 900-999: Array.remove_at()
 
 def test_900_remove_at_valid_index( ):
@@ -867,6 +961,39 @@ def test_1080_insert_at_original_unchanged( ):
     assert original.current == ( True, )
 
 
+def test_1090_insert_at_duplicate_index_matches_validation( ):
+    ''' Duplicate insertion reports same index as full validation. '''
+    from vibecontrols.controls import text
+    element_def = text.TextDefinition( )
+    definition = array.ArrayDefinition(
+        element_definition = element_def, allow_duplicates = False )
+    control = definition.produce_control( initial = [ 'a', 'b', 'c' ] )
+    for index, element in ( ( 0, 'b' ), ( 2, 'a' ), ( 3, 'c' ) ):
+        elements = list( control.current )
+        elements.insert( index, element )
+        with pytest.raises(
+            exceptions.UniquenessConstraintViolation
+        ) as expected:
+            definition.validate_value( elements )
+        with pytest.raises(
+            exceptions.UniquenessConstraintViolation
+        ) as actual:
+            control.insert_at( index, element )
+        assert str( actual.value ) == str( expected.value )
+
+
+def test_1095_insert_at_normalizes_element( ):
+    ''' Inserted element is normalized by element definition. '''
+    from vibecontrols.controls import interval
+    element_def = interval.IntervalDefinition(
+        minimum = 0, maximum = 10, default = 0 )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = definition.produce_control( initial = [ 1.5 ] )
+    inserted = control.insert_at( 0, 3 ).append( 4 )
+    assert inserted.current == ( 3.0, 1.5, 4.0 )
+    assert all( type( element ) is float for element in inserted.current )
+
+
 # 1100-1199: Array.reorder()
 
 def test_1100_reorder_valid_permutation( ):
@@ -939,6 +1066,44 @@ def test_1160_reorder_invalid_duplicates( ):
         control.reorder( [ 0, 0, 1 ] )
 
 
+def test_1162_reorder_invalid_negative_index( ):
+    ''' Negative indices raise InvalidPermutation. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = array.Array(
+        definition = definition, current = ( True, False ) )
+    with pytest.raises( exceptions.InvalidPermutation ):
+        control.reorder( [ -1, 0 ] )
+
+
+def test_1164_reorder_invalid_non_integer_index( ):
+    ''' Non-integer indices raise InvalidPermutation. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = array.Array(
+        definition = definition, current = ( True, False ) )
+    with pytest.raises( exceptions.InvalidPermutation ):
+        control.reorder( [ 1.0, 0 ] )
+
+
+class IntegerLike:
+    ''' Index which is not an integer but converts to one. '''
+
+    def __init__( self, value: int ) -> None: self.value = value
+
+    def __index__( self ) -> int: return self.value
+
+
+def test_1166_reorder_integer_like_indices( ):
+    ''' Indices which convert to integers are accepted. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = array.Array(
+        definition = definition, current = ( True, False ) )
+    reordered = control.reorder( [ IntegerLike( 1 ), IntegerLike( 0 ) ] )
+    assert reordered.current == ( False, True )
+
+
 def test_1170_reorder_returns_new_instance( ):
     ''' reorder() returns a different instance. '''
     element_def = boolean.BooleanDefinition( )
@@ -969,6 +1134,15 @@ def test_1190_reorder_original_unchanged( ):
     assert original.current == ( True, False )
 
 
+def test_1195_reorder_single_element( ):
+    ''' Single-element array reorders to tuple of its element. '''
+    element_def = boolean.BooleanDefinition( )
+    definition = array.ArrayDefinition( element_definition = element_def )
+    control = array.Array( definition = definition, current = ( True, ) )
+    reordered = control.reorder( [ 0 ] )
+    assert reordered.current == ( True, )
+
+
 # 1200-1299: Array.serialize()
 
 def test_1200_serialize_simple_elements( ):
@@ -1003,6 +1177,20 @@ def test_1220_serialize_delegates_to_definition( ):
     assert result == expected
 
 
+class AnswerDefinition( boolean.BooleanDefinition ):
+    ''' Boolean definition which serializes to answers. '''
+
+    def serialize_value( self, value: bool ) -> str:
+        return 'yes' if value else 'no'
+
+
+def test_1230_serialize_overridden_element_serialization( ):
+    ''' Elements serialize with overridden serialization of subclasses. '''
+    definition = array.ArrayDefinition(
+        element_definition = AnswerDefinition( ) )
+    assert definition.serialize_value( ( True, False ) ) == [ 'yes', 'no' ]
+
+
 # 1300-1399: Integration scenarios
 
 def test_1300_complete_lifecycle( ):
@@ -1127,3 +1315,44 @@ def test_1380_duplicate_detection( ):
     # Cannot add duplicate
     with pytest.raises( exceptions.UniquenessConstraintViolation ):
         control.append( True )
+
+
+def test_1390_duplicate_detection_across_mutations( ):
+    ''' Uniqueness tracks elements across successive mutations. '''
+    from vibecontrols.controls import text
+    element_def = text.TextDefinition( )
+    definition = array.ArrayDefinition(
+        element_definition = element_def, allow_duplicates = False )
+    control = definition.produce_control( initial = [ 'a', 'b' ] )
+    control = control.append( 'c' ).reorder( [ 2, 0, 1 ] )
+    with pytest.raises( exceptions.UniquenessConstraintViolation ):
+        control.insert_at( 0, 'b' )
+    control = control.remove_at( 2 )
+    assert control.current == ( 'c', 'a' )
+    control = control.append( 'b' )
+    assert control.current == ( 'c', 'a', 'b' )
+    with pytest.raises( exceptions.UniquenessConstraintViolation ):
+        control.append( 'a' )
+
+
+class SingletonArrayDefinition( array.ArrayDefinition ):
+    ''' Array definition which holds at most one element. '''
+
+    def validate_value( self, value: object ) -> tuple[ object, ... ]:
+        validated = super( ).validate_value( value )
+        if len( validated ) > 1:
+            raise exceptions.ConstraintViolation( "At most one element" )
+        return validated
+
+
+def test_1410_subclass_validation_override( ):
+    ''' Edits validate with overridden validation. '''
+    definition = SingletonArrayDefinition(
+        element_definition = boolean.BooleanDefinition( ) )
+    control = definition.produce_control( [ True ] )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.append( False )
+    with pytest.raises( exceptions.ConstraintViolation ):
+        control.insert_at( 0, False )
+    assert control.remove_at( 0 ).current == ( )
+    assert control.reorder( [ 0 ] ).current == ( True, )